@@ -9,8 +9,13 @@ from typing import Optional
 import click
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from . import __version__
-from .config import config_manager
+from .config import get_config_manager
 from .services.export_service import ExportService
 from .services.live_monitor import LiveMonitor
 from .services.report_generator import ReportGenerator
@@ -34,6 +39,20 @@ def json_serializer(obj):
         return str(obj)
 
 
+def dumps_json(data) -> str:
+    """Serialize report data to indented JSON.
+
+    Uses orjson's C encoder when it is installed (the `speed` extra) and
+    falls back to the stdlib encoder otherwise; both produce 2-space
+    indented output.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=json_serializer, option=orjson.OPT_INDENT_2
+        ).decode()
+    return json.dumps(data, indent=2, default=json_serializer)
+
+
 @click.group()
 @click.version_option(version=__version__)
 @click.option(
@@ -55,6 +74,7 @@ def cli(ctx: click.Context, config: Optional[str], verbose: bool):
 
     # Load configuration
     try:
+        config_manager = get_config_manager()
         if config:
             config_manager.config_path = config
             config_manager.reload()
@@ -109,7 +129,7 @@ def session(ctx: click.Context, path: Optional[str], output_format: str):
             ctx.exit(1)
 
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2, default=json_serializer))
+            click.echo(dumps_json(result))
         elif output_format == "csv":
             click.echo(
                 "CSV data would be exported to file. Use 'export' command for file output."
@@ -180,7 +200,7 @@ def sessions(
         )
 
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2, default=json_serializer))
+            click.echo(dumps_json(result))
         elif output_format == "csv":
             click.echo(
                 "CSV data would be exported to file. Use 'export' command for file output."
@@ -284,7 +304,7 @@ def daily(
         )
 
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2, default=json_serializer))
+            click.echo(dumps_json(result))
         elif output_format == "csv":
             click.echo(
                 "CSV data would be exported to file. Use 'export' command for file output."
@@ -355,7 +375,7 @@ def weekly(
         )
 
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2, default=json_serializer))
+            click.echo(dumps_json(result))
         elif output_format == "csv":
             click.echo(
                 "CSV data would be exported to file. Use 'export' command for file output."
@@ -406,7 +426,7 @@ def monthly(
         )
 
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2, default=json_serializer))
+            click.echo(dumps_json(result))
         elif output_format == "csv":
             click.echo(
                 "CSV data would be exported to file. Use 'export' command for file output."
@@ -464,7 +484,7 @@ def models(
         )
 
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2, default=json_serializer))
+            click.echo(dumps_json(result))
         elif output_format == "csv":
             click.echo(
                 "CSV data would be exported to file. Use 'export' command for file output."
@@ -522,7 +542,7 @@ def projects(
         )
 
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2, default=json_serializer))
+            click.echo(dumps_json(result))
         elif output_format == "csv":
             click.echo(
                 "CSV data would be exported to file. Use 'export' command for file output."
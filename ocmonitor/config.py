@@ -3,11 +3,47 @@
 import json
 import os
 import toml
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Literal, Mapping, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 from decimal import Decimal
 
+# Fixed-point scale applied to per-1M-token prices so hot aggregation loops
+# can accumulate costs as plain integers instead of Decimals.
+COST_SCALE = 10 ** 10
+
+
+def scaled_cost_to_decimal(value: int) -> Decimal:
+    """Convert an integer cost accumulated from *_scaled prices to USD.
+
+    The scaled prices are per 1M tokens and multiplied by COST_SCALE, so the
+    combined conversion factor is COST_SCALE * 1_000_000.
+    """
+    return Decimal(value) / (COST_SCALE * 1_000_000)
+
+def _file_signature(path: str) -> Optional[tuple]:
+    """Get an (mtime_ns, size) change signature for a file, or None if missing."""
+    try:
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def _scan_dir_names(parent: str) -> frozenset:
+    """List entry names in a directory, tolerating missing directories.
+
+    Used to probe several candidate file paths with one scandir per parent
+    directory instead of one stat syscall per candidate.
+    """
+    try:
+        return frozenset(entry.name for entry in os.scandir(parent or "."))
+    except OSError:
+        return frozenset()
+
+
 def opencode_storage_path(path: Optional[str] = None) -> str:
     base = os.getenv("XDG_DATA_HOME") or "~/.local/share"
     parts = [base, "opencode", "storage"]
@@ -16,6 +52,12 @@ def opencode_storage_path(path: Optional[str] = None) -> str:
     return os.path.join(*parts)
 
 
+@lru_cache(maxsize=64)
+def _expand_path(value: str) -> str:
+    """Expand user home and environment variables, caching repeated paths."""
+    return os.path.expanduser(os.path.expandvars(value))
+
+
 class PathsConfig(BaseModel):
     """Configuration for file paths."""
     messages_dir: str = Field(default=opencode_storage_path("message"))
@@ -26,12 +68,12 @@ class PathsConfig(BaseModel):
     @classmethod
     def expand_path(cls, v):
         """Expand user paths and environment variables."""
-        return os.path.expanduser(os.path.expandvars(v))
+        return _expand_path(v)
 
 
 class UIConfig(BaseModel):
     """Configuration for UI appearance."""
-    table_style: str = Field(default="rich", pattern="^(rich|simple|minimal)$")
+    table_style: Literal["rich", "simple", "minimal"] = Field(default="rich")
     progress_bars: bool = Field(default=True)
     colors: bool = Field(default=True)
     live_refresh_interval: int = Field(default=5, ge=1, le=60)
@@ -39,7 +81,7 @@ class UIConfig(BaseModel):
 
 class ExportConfig(BaseModel):
     """Configuration for data export."""
-    default_format: str = Field(default="csv", pattern="^(csv|json)$")
+    default_format: Literal["csv", "json"] = Field(default="csv")
     include_metadata: bool = Field(default=True)
     include_raw_data: bool = Field(default=False)
 
@@ -51,7 +93,7 @@ class ModelsConfig(BaseModel):
 
 class AnalyticsConfig(BaseModel):
     """Configuration for analytics."""
-    default_timeframe: str = Field(default="daily", pattern="^(daily|weekly|monthly)$")
+    default_timeframe: Literal["daily", "weekly", "monthly"] = Field(default="daily")
     recent_sessions_limit: int = Field(default=50, ge=1, le=1000)
 
 
@@ -73,6 +115,28 @@ class ModelPricing(BaseModel):
     context_window: int = Field(alias="contextWindow", description="Maximum context window size")
     session_quota: Decimal = Field(alias="sessionQuota", description="Maximum session cost quota")
 
+    # Integer prices (price * COST_SCALE) precomputed for hot-loop cost math
+    input_scaled: int = Field(default=0, exclude=True)
+    output_scaled: int = Field(default=0, exclude=True)
+    cache_write_scaled: int = Field(default=0, exclude=True)
+    cache_read_scaled: int = Field(default=0, exclude=True)
+
+    @model_validator(mode='after')
+    def _precompute_scaled_prices(self):
+        """Precompute scaled integer prices once at load time."""
+        self.input_scaled = int(self.input * COST_SCALE)
+        self.output_scaled = int(self.output * COST_SCALE)
+        self.cache_write_scaled = int(self.cache_write * COST_SCALE)
+        self.cache_read_scaled = int(self.cache_read * COST_SCALE)
+        return self
+
+
+# Validation entry points built once at import; TypeAdapter caches the
+# compiled core schema, so repeated loads skip Pydantic's schema dispatch
+# and pricing files validate in a single pass instead of per-entry.
+_CONFIG_ADAPTER = TypeAdapter(Config)
+_PRICING_ADAPTER = TypeAdapter(Dict[str, ModelPricing])
+
 
 class ConfigManager:
     """Manages configuration loading and access."""
@@ -83,9 +147,29 @@ class ConfigManager:
         Args:
             config_path: Path to configuration file. If None, searches standard locations.
         """
-        self.config_path = config_path or self._find_config_file()
+        self._config_path = config_path
         self._config: Optional[Config] = None
-        self._pricing_data: Optional[Dict[str, ModelPricing]] = None
+        self._config_signature: Optional[tuple] = None
+        self._pricing_data: Optional[Mapping[str, ModelPricing]] = None
+        self._pricing_file: Optional[str] = None
+        self._pricing_signature: Optional[tuple] = None
+
+    @property
+    def config_path(self) -> str:
+        """Get configuration file path, searching standard locations lazily."""
+        if self._config_path is None:
+            self._config_path = self._find_config_file()
+        return self._config_path
+
+    @config_path.setter
+    def config_path(self, value: str):
+        self._config_path = value
+        # Drop everything derived from the old file, not just the
+        # signature: a missing new path also signs as None, so a
+        # signature comparison alone cannot detect the repoint
+        self._config = None
+        self._config_signature = None
+        self._pricing_data = None
 
     def _find_config_file(self) -> str:
         """Find configuration file in standard locations."""
@@ -96,8 +180,14 @@ class ConfigManager:
             "ocmonitor.toml",
         ]
 
+        # Probe each unique parent directory once rather than stat-ing every
+        # candidate path individually
+        dir_names: Dict[str, frozenset] = {}
         for path in search_paths:
-            if os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent not in dir_names:
+                dir_names[parent] = _scan_dir_names(parent)
+            if os.path.basename(path) in dir_names[parent]:
                 return path
 
         # Return default path even if it doesn't exist
@@ -112,21 +202,28 @@ class ConfigManager:
 
     def _load_config(self) -> Config:
         """Load configuration from TOML file."""
-        if not os.path.exists(self.config_path):
+        self._config_signature = _file_signature(self.config_path)
+
+        if self._config_signature is None:
             # Return default configuration if file doesn't exist
             return Config()
 
         try:
             with open(self.config_path, 'r') as f:
                 config_data = toml.load(f)
-            return Config(**config_data)
+            return _CONFIG_ADAPTER.validate_python(config_data)
         except (toml.TomlDecodeError, ValueError) as e:
             raise ValueError(f"Invalid configuration file {self.config_path}: {e}")
 
-    def load_pricing_data(self) -> Dict[str, ModelPricing]:
-        """Load model pricing data."""
+    def load_pricing_data(self) -> Mapping[str, ModelPricing]:
+        """Load model pricing data.
+
+        The returned mapping is read-only: per-session cost caches are
+        keyed on its identity, so shielding it from mutation keeps those
+        cached values trustworthy for the lifetime of the mapping.
+        """
         if self._pricing_data is None:
-            self._pricing_data = self._load_pricing_data()
+            self._pricing_data = MappingProxyType(self._load_pricing_data())
         return self._pricing_data
 
     def _load_pricing_data(self) -> Dict[str, ModelPricing]:
@@ -138,22 +235,31 @@ class ConfigManager:
             config_dir = os.path.dirname(self.config_path)
             models_file = os.path.join(config_dir, models_file)
 
-        if not os.path.exists(models_file):
-            # Try in same directory as this module
-            models_file = os.path.join(os.path.dirname(__file__), "models.json")
+        # Fall back to the module directory; probe each candidate through a
+        # single directory listing per parent
+        candidates = [
+            models_file,
+            os.path.join(os.path.dirname(__file__), "models.json"),
+        ]
+        models_file = None
+        for candidate in candidates:
+            if os.path.basename(candidate) in _scan_dir_names(os.path.dirname(candidate)):
+                models_file = candidate
+                break
+
+        self._pricing_file = models_file
+        self._pricing_signature = _file_signature(models_file) if models_file else None
 
-        if not os.path.exists(models_file):
+        if models_file is None:
             return {}
 
         try:
-            with open(models_file, 'r') as f:
-                raw_data = json.load(f)
+            # Decode the raw bytes directly; json.loads on bytes skips the
+            # text-IO decoding layer that json.load(f) goes through
+            with open(models_file, 'rb') as f:
+                raw_data = json.loads(f.read())
 
-            pricing_data = {}
-            for model_name, model_data in raw_data.items():
-                pricing_data[model_name] = ModelPricing(**model_data)
-
-            return pricing_data
+            return _PRICING_ADAPTER.validate_python(raw_data)
         except (json.JSONDecodeError, ValueError) as e:
             raise ValueError(f"Invalid pricing file {models_file}: {e}")
 
@@ -163,10 +269,34 @@ class ConfigManager:
         return pricing_data.get(model_name)
 
     def reload(self):
-        """Reload configuration and pricing data."""
-        self._config = None
-        self._pricing_data = None
-
+        """Reload configuration and pricing data.
 
-# Global configuration manager instance
-config_manager = ConfigManager()
\ No newline at end of file
+        Parsed values are kept when the underlying files are unchanged
+        (same mtime and size), so repeated reloads skip TOML/JSON parsing
+        and Pydantic validation entirely.
+        """
+        if self._config_signature != _file_signature(self.config_path):
+            self._config = None
+            # The pricing file location depends on the config, so drop it too
+            self._pricing_data = None
+            return
+
+        pricing_signature = (
+            _file_signature(self._pricing_file) if self._pricing_file else None
+        )
+        if pricing_signature != self._pricing_signature:
+            self._pricing_data = None
+
+
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Get the process-wide configuration manager, creating it on first use."""
+    return ConfigManager()
+
+
+def __getattr__(name):
+    # Lazy module attribute so importing this module doesn't probe the
+    # filesystem for configuration files on every process start.
+    if name == "config_manager":
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,127 +1,126 @@
 """Analytics data models for OpenCode Monitor."""
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Any, Optional
 from decimal import Decimal
-from pydantic import BaseModel, Field, computed_field
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 from collections import defaultdict
-from .session import SessionData, TokenUsage
+from ..config import scaled_cost_to_decimal
+from .session import SessionData, TokenUsage, _pinned_cache_get
+
+
+
+def _filter_sessions_by_date(
+    sessions: List["SessionData"],
+    start_date: Optional[date],
+    end_date: Optional[date]
+) -> List["SessionData"]:
+    """Filter sessions to those starting within [start_date, end_date].
+
+    When the sessions happen to be sorted by start date (the common case,
+    since callers sort by start_time), the range bounds are found with two
+    bisections and a single slice instead of two comparisons per session.
+    Unsorted or partially dated input falls back to a plain loop.
+    """
+    if not (start_date or end_date):
+        return sessions
+
+    dates = [session.start_date for session in sessions]
+    sortable = dates and all(
+        earlier is not None and later is not None and earlier <= later
+        for earlier, later in zip(dates, dates[1:])
+    ) and dates[0] is not None
+
+    if sortable:
+        lo = bisect_left(dates, start_date) if start_date else 0
+        hi = bisect_right(dates, end_date) if end_date else len(dates)
+        return sessions[lo:hi]
+
+    filtered = []
+    for session, session_date in zip(sessions, dates):
+        if session_date:
+            if start_date and session_date < start_date:
+                continue
+            if end_date and session_date > end_date:
+                continue
+            filtered.append(session)
+    return filtered
 
 
 class DailyUsage(BaseModel):
     """Model for daily usage statistics."""
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=True)
     date: date
     sessions: List[SessionData] = Field(default_factory=list)
+    models_used: List[str] = Field(
+        default_factory=list,
+        description="Unique models used on this day, in first-seen order"
+    )
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
+    total_interactions: int = Field(default=0)
 
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens for the day."""
-        total = TokenUsage()
-        for session in self.sessions:
-            session_tokens = session.total_tokens
-            total.input += session_tokens.input
-            total.output += session_tokens.output
-            total.cache_write += session_tokens.cache_write
-            total.cache_read += session_tokens.cache_read
-        return total
-
-    @computed_field
-    @property
-    def total_interactions(self) -> int:
-        """Calculate total interactions for the day."""
-        return sum(session.interaction_count for session in self.sessions)
-
-    @computed_field
-    @property
-    def models_used(self) -> List[str]:
-        """Get unique models used on this day."""
-        models = set()
-        for session in self.sessions:
-            models.update(session.models_used)
-        return list(models)
+    # Cost per pricing-mapping identity, same pattern as SessionData, so
+    # table rows and the JSON/CSV formatters compute each day's cost once
+    _cost_cache: Dict[int, tuple] = PrivateAttr(default_factory=dict)
 
     def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate total cost for the day."""
-        return sum((session.calculate_total_cost(pricing_data) for session in self.sessions), Decimal('0.0'))
+        cached = _pinned_cache_get(self._cost_cache, pricing_data)
+        if cached is None:
+            cached = sum((session.calculate_total_cost(pricing_data) for session in self.sessions), Decimal('0.0'))
+            self._cost_cache[id(pricing_data)] = (pricing_data, cached)
+        return cached
 
 
 class WeeklyUsage(BaseModel):
     """Model for weekly usage statistics."""
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=True)
     year: int
     week: int
     start_date: date
     end_date: date
     daily_usage: List[DailyUsage] = Field(default_factory=list)
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
+    total_sessions: int = Field(default=0)
+    total_interactions: int = Field(default=0)
 
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens for the week."""
-        total = TokenUsage()
-        for day in self.daily_usage:
-            day_tokens = day.total_tokens
-            total.input += day_tokens.input
-            total.output += day_tokens.output
-            total.cache_write += day_tokens.cache_write
-            total.cache_read += day_tokens.cache_read
-        return total
-
-    @computed_field
-    @property
-    def total_sessions(self) -> int:
-        """Calculate total sessions for the week."""
-        return sum(len(day.sessions) for day in self.daily_usage)
-
-    @computed_field
-    @property
-    def total_interactions(self) -> int:
-        """Calculate total interactions for the week."""
-        return sum(day.total_interactions for day in self.daily_usage)
+    _cost_cache: Dict[int, tuple] = PrivateAttr(default_factory=dict)
 
     def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate total cost for the week."""
-        return sum((day.calculate_total_cost(pricing_data) for day in self.daily_usage), Decimal('0.0'))
+        cached = _pinned_cache_get(self._cost_cache, pricing_data)
+        if cached is None:
+            cached = sum((day.calculate_total_cost(pricing_data) for day in self.daily_usage), Decimal('0.0'))
+            self._cost_cache[id(pricing_data)] = (pricing_data, cached)
+        return cached
 
 
 class MonthlyUsage(BaseModel):
     """Model for monthly usage statistics."""
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=True)
     year: int
     month: int
     weekly_usage: List[WeeklyUsage] = Field(default_factory=list)
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
+    total_sessions: int = Field(default=0)
+    total_interactions: int = Field(default=0)
 
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens for the month."""
-        total = TokenUsage()
-        for week in self.weekly_usage:
-            week_tokens = week.total_tokens
-            total.input += week_tokens.input
-            total.output += week_tokens.output
-            total.cache_write += week_tokens.cache_write
-            total.cache_read += week_tokens.cache_read
-        return total
-
-    @computed_field
-    @property
-    def total_sessions(self) -> int:
-        """Calculate total sessions for the month."""
-        return sum(week.total_sessions for week in self.weekly_usage)
-
-    @computed_field
-    @property
-    def total_interactions(self) -> int:
-        """Calculate total interactions for the month."""
-        return sum(week.total_interactions for week in self.weekly_usage)
+    _cost_cache: Dict[int, tuple] = PrivateAttr(default_factory=dict)
 
     def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate total cost for the month."""
-        return sum((week.calculate_total_cost(pricing_data) for week in self.weekly_usage), Decimal('0.0'))
+        cached = _pinned_cache_get(self._cost_cache, pricing_data)
+        if cached is None:
+            cached = sum((week.calculate_total_cost(pricing_data) for week in self.weekly_usage), Decimal('0.0'))
+            self._cost_cache[id(pricing_data)] = (pricing_data, cached)
+        return cached
 
 
 class ModelUsageStats(BaseModel):
     """Model for model-specific usage statistics."""
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=True)
     model_name: str
     total_tokens: TokenUsage = Field(default_factory=TokenUsage)
     total_sessions: int = Field(default=0)
@@ -132,7 +131,7 @@ class ModelUsageStats(BaseModel):
     last_used: Optional[datetime] = Field(default=None)
 
     @computed_field
-    @property
+    @cached_property
     def avg_output_rate(self) -> float:
         """Calculate average output tokens per second."""
         if self.total_duration_ms <= 0 or self.total_tokens.output == 0:
@@ -140,35 +139,31 @@ class ModelUsageStats(BaseModel):
         duration_seconds = self.total_duration_ms / 1000
         return self.total_tokens.output / duration_seconds
 
+    @cached_property
+    def total_cost_float(self) -> float:
+        """Float view of total_cost, cast once for export formatters."""
+        return float(self.total_cost)
+
 
 class ModelBreakdownReport(BaseModel):
     """Model for model usage breakdown report."""
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=True)
     timeframe: str  # "daily", "weekly", "monthly", "all"
     start_date: Optional[date] = Field(default=None)
     end_date: Optional[date] = Field(default=None)
     model_stats: List[ModelUsageStats] = Field(default_factory=list)
+    total_cost: Decimal = Field(default=Decimal('0.0'))
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
 
-    @computed_field
-    @property
-    def total_cost(self) -> Decimal:
-        """Calculate total cost across all models."""
-        return sum((model.total_cost for model in self.model_stats), Decimal('0.0'))
-
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens across all models."""
-        total = TokenUsage()
-        for model in self.model_stats:
-            total.input += model.total_tokens.input
-            total.output += model.total_tokens.output
-            total.cache_write += model.total_tokens.cache_write
-            total.cache_read += model.total_tokens.cache_read
-        return total
+    @cached_property
+    def total_cost_float(self) -> float:
+        """Float view of total_cost, cast once for export formatters."""
+        return float(self.total_cost)
 
 
 class ProjectUsageStats(BaseModel):
     """Model for project-specific usage statistics."""
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=True)
     project_name: str
     total_tokens: TokenUsage = Field(default_factory=TokenUsage)
     total_sessions: int = Field(default=0)
@@ -178,31 +173,68 @@ class ProjectUsageStats(BaseModel):
     first_activity: Optional[datetime] = Field(default=None)
     last_activity: Optional[datetime] = Field(default=None)
 
+    @cached_property
+    def total_cost_float(self) -> float:
+        """Float view of total_cost, cast once for export formatters."""
+        return float(self.total_cost)
+
 
 class ProjectBreakdownReport(BaseModel):
     """Model for project usage breakdown report."""
+    model_config = ConfigDict(revalidate_instances='never', arbitrary_types_allowed=True)
     timeframe: str  # "daily", "weekly", "monthly", "all"
     start_date: Optional[date] = Field(default=None)
     end_date: Optional[date] = Field(default=None)
     project_stats: List[ProjectUsageStats] = Field(default_factory=list)
+    total_cost: Decimal = Field(default=Decimal('0.0'))
+    total_tokens: TokenUsage = Field(default_factory=TokenUsage)
 
-    @computed_field
-    @property
-    def total_cost(self) -> Decimal:
-        """Calculate total cost across all projects."""
-        return sum(project.total_cost for project in self.project_stats)
-
-    @computed_field
-    @property
-    def total_tokens(self) -> TokenUsage:
-        """Calculate total tokens across all projects."""
-        total = TokenUsage()
-        for project in self.project_stats:
-            total.input += project.total_tokens.input
-            total.output += project.total_tokens.output
-            total.cache_write += project.total_tokens.cache_write
-            total.cache_read += project.total_tokens.cache_read
-        return total
+    @cached_property
+    def total_cost_float(self) -> float:
+        """Float view of total_cost, cast once for export formatters."""
+        return float(self.total_cost)
+
+
+class _ModelAccumulator:
+    """Mutable per-model accumulator for create_model_breakdown.
+
+    Slotted attributes are cheaper to read/write than dict entries and
+    avoid allocating a fresh dict per model key.
+    """
+    __slots__ = ('input', 'output', 'cache_write', 'cache_read', 'sessions',
+                 'interactions', 'cost_scaled', 'duration_ms',
+                 'first_used', 'last_used')
+
+    def __init__(self):
+        self.input = 0
+        self.output = 0
+        self.cache_write = 0
+        self.cache_read = 0
+        self.sessions = set()
+        self.interactions = 0
+        self.cost_scaled = 0
+        self.duration_ms = 0
+        self.first_used = None
+        self.last_used = None
+
+
+class _ProjectAccumulator:
+    """Mutable per-project accumulator for create_project_breakdown."""
+    __slots__ = ('input', 'output', 'cache_write', 'cache_read', 'sessions',
+                 'interactions', 'cost', 'models_used',
+                 'first_activity', 'last_activity')
+
+    def __init__(self):
+        self.input = 0
+        self.output = 0
+        self.cache_write = 0
+        self.cache_read = 0
+        self.sessions = 0
+        self.interactions = 0
+        self.cost = Decimal('0.0')
+        self.models_used = set()
+        self.first_activity = None
+        self.last_activity = None
 
 
 class TimeframeAnalyzer:
@@ -214,14 +246,34 @@ class TimeframeAnalyzer:
         daily_data = defaultdict(list)
 
         for session in sessions:
-            if session.start_time:
-                session_date = session.start_time.date()
+            session_date = session.start_date
+            if session_date:
                 daily_data[session_date].append(session)
 
-        return [
-            DailyUsage(date=date_key, sessions=sessions_list)
-            for date_key, sessions_list in sorted(daily_data.items())
-        ]
+        # model_construct skips validation; trusted: data comes from
+        # already-validated SessionData objects. Totals are summed here once
+        # so later reads (and serialization) never re-walk the sessions.
+        daily_breakdown = []
+        for date_key, sessions_list in sorted(daily_data.items()):
+            day_tokens = TokenUsage()
+            day_interactions = 0
+            for session in sessions_list:
+                day_tokens += session.total_tokens
+                day_interactions += session.interaction_count
+
+            daily_breakdown.append(DailyUsage.model_construct(
+                date=date_key,
+                sessions=sessions_list,
+                models_used=list(dict.fromkeys(
+                    model
+                    for session in sessions_list
+                    for model in session.models_used
+                )),
+                total_tokens=day_tokens,
+                total_interactions=day_interactions
+            ))
+
+        return daily_breakdown
 
     @staticmethod
     def create_weekly_breakdown(daily_usage: List[DailyUsage], week_start_day: int = 0) -> List[WeeklyUsage]:
@@ -251,12 +303,20 @@ class TimeframeAnalyzer:
             # For display purposes, calculate ISO week number for the week_start
             year, week, _ = week_start.isocalendar()
             
-            weekly_breakdown.append(WeeklyUsage(
+            week_tokens = TokenUsage()
+            for day in days:
+                week_tokens += day.total_tokens
+
+            # Trusted data from already-validated DailyUsage objects
+            weekly_breakdown.append(WeeklyUsage.model_construct(
                 year=year,
                 week=week,
                 start_date=week_start,
                 end_date=week_end,
-                daily_usage=sorted(days, key=lambda d: d.date)
+                daily_usage=sorted(days, key=lambda d: d.date),
+                total_tokens=week_tokens,
+                total_sessions=sum(len(day.sessions) for day in days),
+                total_interactions=sum(day.total_interactions for day in days)
             ))
 
         return weekly_breakdown
@@ -271,10 +331,88 @@ class TimeframeAnalyzer:
             month_key = (week.start_date.year, week.start_date.month)
             monthly_data[month_key].append(week)
 
-        return [
-            MonthlyUsage(year=year, month=month, weekly_usage=weeks)
-            for (year, month), weeks in sorted(monthly_data.items())
-        ]
+        # Trusted data from already-validated WeeklyUsage objects
+        monthly_breakdown = []
+        for (year, month), weeks in sorted(monthly_data.items()):
+            month_tokens = TokenUsage()
+            for week in weeks:
+                month_tokens += week.total_tokens
+
+            monthly_breakdown.append(MonthlyUsage.model_construct(
+                year=year,
+                month=month,
+                weekly_usage=weeks,
+                total_tokens=month_tokens,
+                total_sessions=sum(week.total_sessions for week in weeks),
+                total_interactions=sum(week.total_interactions for week in weeks)
+            ))
+
+        return monthly_breakdown
+
+    @staticmethod
+    def create_all_breakdowns(
+        sessions: List[SessionData],
+        week_start_day: int = 0
+    ) -> tuple:
+        """Create daily, weekly and monthly breakdowns in one pass.
+
+        Grouping sessions by date happens once and the weekly/monthly
+        layers are built from the shared DailyUsage objects, instead of
+        each caller re-running the daily grouping per timeframe.
+
+        Args:
+            sessions: List of sessions to analyze
+            week_start_day: Day to start week on (0=Monday, 6=Sunday)
+
+        Returns:
+            Tuple of (daily, weekly, monthly) breakdown lists
+        """
+        from ..utils.time_utils import TimeUtils
+
+        daily_usage = TimeframeAnalyzer.create_daily_breakdown(sessions)
+
+        weekly_data = defaultdict(list)
+        monthly_data = defaultdict(list)
+        for day in daily_usage:
+            week_key = TimeUtils.get_custom_week_range(day.date, week_start_day)
+            weekly_data[week_key].append(day)
+
+        weekly_usage = []
+        for (week_start, week_end), days in sorted(weekly_data.items()):
+            year, week, _ = week_start.isocalendar()
+            week_tokens = TokenUsage()
+            for day in days:
+                week_tokens += day.total_tokens
+
+            weekly = WeeklyUsage.model_construct(
+                year=year,
+                week=week,
+                start_date=week_start,
+                end_date=week_end,
+                daily_usage=days,
+                total_tokens=week_tokens,
+                total_sessions=sum(len(day.sessions) for day in days),
+                total_interactions=sum(day.total_interactions for day in days)
+            )
+            weekly_usage.append(weekly)
+            monthly_data[(week_start.year, week_start.month)].append(weekly)
+
+        monthly_usage = []
+        for (year, month), weeks in sorted(monthly_data.items()):
+            month_tokens = TokenUsage()
+            for week in weeks:
+                month_tokens += week.total_tokens
+
+            monthly_usage.append(MonthlyUsage.model_construct(
+                year=year,
+                month=month,
+                weekly_usage=weeks,
+                total_tokens=month_tokens,
+                total_sessions=sum(week.total_sessions for week in weeks),
+                total_interactions=sum(week.total_interactions for week in weeks)
+            ))
+
+        return daily_usage, weekly_usage, monthly_usage
 
     @staticmethod
     def create_model_breakdown(
@@ -285,82 +423,83 @@ class TimeframeAnalyzer:
         end_date: Optional[date] = None
     ) -> ModelBreakdownReport:
         """Create model usage breakdown."""
-        # Filter sessions by date range if specified
-        filtered_sessions = sessions
-        if start_date or end_date:
-            filtered_sessions = []
-            for session in sessions:
-                if session.start_time:
-                    session_date = session.start_time.date()
-                    if start_date and session_date < start_date:
-                        continue
-                    if end_date and session_date > end_date:
-                        continue
-                    filtered_sessions.append(session)
-
-        model_data = defaultdict(lambda: {
-            'tokens': TokenUsage(),
-            'sessions': set(),
-            'interactions': 0,
-            'cost': Decimal('0.0'),
-            'duration_ms': 0,
-            'first_used': None,
-            'last_used': None
-        })
+        filtered_sessions = _filter_sessions_by_date(sessions, start_date, end_date)
+
+        # Columnar int accumulators: plain-int adds are much cheaper than
+        # attribute updates on a Pydantic TokenUsage accumulator
+        model_data = defaultdict(_ModelAccumulator)
 
         for session in filtered_sessions:
-            for model in session.models_used:
-                model_files = [f for f in session.files if f.model_id == model]
-                model_stats = model_data[model]
+            # Single pass over files instead of one rescan per model
+            session_models = set()
+            for file in session.files:
+                model_stats = model_data[file.model_id]
+                session_models.add(file.model_id)
 
                 # Update token counts
-                for file in model_files:
-                    model_stats['tokens'].input += file.tokens.input
-                    model_stats['tokens'].output += file.tokens.output
-                    model_stats['tokens'].cache_write += file.tokens.cache_write
-                    model_stats['tokens'].cache_read += file.tokens.cache_read
-                    model_stats['interactions'] += 1
-                    model_stats['cost'] += file.calculate_cost(pricing_data)
-                    # Track processing duration
-                    if file.time_data and file.time_data.duration_ms:
-                        model_stats['duration_ms'] += file.time_data.duration_ms
+                file_tokens = file.tokens
+                model_stats.input += file_tokens.input
+                model_stats.output += file_tokens.output
+                model_stats.cache_write += file_tokens.cache_write
+                model_stats.cache_read += file_tokens.cache_read
+                model_stats.interactions += 1
+                model_stats.cost_scaled += file.calculate_cost_scaled(pricing_data)
+                # Track processing duration
+                if file.time_data and file.time_data.duration_ms:
+                    model_stats.duration_ms += file.time_data.duration_ms
+
+            # Per-session bookkeeping once per distinct model
+            for model in session_models:
+                model_stats = model_data[model]
 
                 # Track sessions
-                model_stats['sessions'].add(session.session_id)
+                model_stats.sessions.add(session.session_id)
 
                 # Update first/last used times
                 if session.start_time:
-                    if (model_stats['first_used'] is None or
-                        session.start_time < model_stats['first_used']):
-                        model_stats['first_used'] = session.start_time
+                    if (model_stats.first_used is None or
+                        session.start_time < model_stats.first_used):
+                        model_stats.first_used = session.start_time
 
                 if session.end_time:
-                    if (model_stats['last_used'] is None or
-                        session.end_time > model_stats['last_used']):
-                        model_stats['last_used'] = session.end_time
+                    if (model_stats.last_used is None or
+                        session.end_time > model_stats.last_used):
+                        model_stats.last_used = session.end_time
 
         # Convert to ModelUsageStats objects
         model_stats_list = []
         for model_name, stats in model_data.items():
-            model_stats_list.append(ModelUsageStats(
+            # Trusted data aggregated from already-validated sessions
+            model_stats_list.append(ModelUsageStats.model_construct(
                 model_name=model_name,
-                total_tokens=stats['tokens'],
-                total_sessions=len(stats['sessions']),
-                total_interactions=stats['interactions'],
-                total_cost=stats['cost'],
-                total_duration_ms=stats['duration_ms'],
-                first_used=stats['first_used'],
-                last_used=stats['last_used']
+                total_tokens=TokenUsage.model_construct(
+                    input=stats.input,
+                    output=stats.output,
+                    cache_write=stats.cache_write,
+                    cache_read=stats.cache_read
+                ),
+                total_sessions=len(stats.sessions),
+                total_interactions=stats.interactions,
+                total_cost=scaled_cost_to_decimal(stats.cost_scaled),
+                total_duration_ms=stats.duration_ms,
+                first_used=stats.first_used,
+                last_used=stats.last_used
             ))
 
         # Sort by total cost descending
         model_stats_list.sort(key=lambda x: x.total_cost, reverse=True)
 
-        return ModelBreakdownReport(
+        report_tokens = TokenUsage()
+        for model in model_stats_list:
+            report_tokens += model.total_tokens
+
+        return ModelBreakdownReport.model_construct(
             timeframe=timeframe,
             start_date=start_date,
             end_date=end_date,
-            model_stats=model_stats_list
+            model_stats=model_stats_list,
+            total_cost=sum((model.total_cost for model in model_stats_list), Decimal('0.0')),
+            total_tokens=report_tokens
         )
 
     @staticmethod
@@ -372,28 +511,9 @@ class TimeframeAnalyzer:
         end_date: Optional[date] = None
     ) -> 'ProjectBreakdownReport':
         """Create project usage breakdown."""
-        # Filter sessions by date range if specified
-        filtered_sessions = sessions
-        if start_date or end_date:
-            filtered_sessions = []
-            for session in sessions:
-                if session.start_time:
-                    session_date = session.start_time.date()
-                    if start_date and session_date < start_date:
-                        continue
-                    if end_date and session_date > end_date:
-                        continue
-                    filtered_sessions.append(session)
-
-        project_data = defaultdict(lambda: {
-            'tokens': TokenUsage(),
-            'sessions': 0,
-            'interactions': 0,
-            'cost': Decimal('0.0'),
-            'models_used': set(),
-            'first_activity': None,
-            'last_activity': None
-        })
+        filtered_sessions = _filter_sessions_by_date(sessions, start_date, end_date)
+
+        project_data = defaultdict(_ProjectAccumulator)
 
         for session in filtered_sessions:
             project_name = session.project_name or "Unknown"
@@ -401,47 +521,59 @@ class TimeframeAnalyzer:
             
             # Update aggregated data
             session_tokens = session.total_tokens
-            project_stats['tokens'].input += session_tokens.input
-            project_stats['tokens'].output += session_tokens.output
-            project_stats['tokens'].cache_write += session_tokens.cache_write
-            project_stats['tokens'].cache_read += session_tokens.cache_read
-            
-            project_stats['sessions'] += 1
-            project_stats['interactions'] += session.interaction_count
-            project_stats['cost'] += session.calculate_total_cost(pricing_data)
-            project_stats['models_used'].update(session.models_used)
-            
+            project_stats.input += session_tokens.input
+            project_stats.output += session_tokens.output
+            project_stats.cache_write += session_tokens.cache_write
+            project_stats.cache_read += session_tokens.cache_read
+
+            project_stats.sessions += 1
+            project_stats.interactions += session.interaction_count
+            project_stats.cost += session.calculate_total_cost(pricing_data)
+            project_stats.models_used.update(session.models_used)
+
             # Track first/last activity times
             if session.start_time:
-                if (project_stats['first_activity'] is None or 
-                    session.start_time < project_stats['first_activity']):
-                    project_stats['first_activity'] = session.start_time
-                    
+                if (project_stats.first_activity is None or
+                    session.start_time < project_stats.first_activity):
+                    project_stats.first_activity = session.start_time
+
             if session.end_time:
-                if (project_stats['last_activity'] is None or 
-                    session.end_time > project_stats['last_activity']):
-                    project_stats['last_activity'] = session.end_time
+                if (project_stats.last_activity is None or
+                    session.end_time > project_stats.last_activity):
+                    project_stats.last_activity = session.end_time
 
         # Convert to ProjectUsageStats objects
         project_stats = []
         for project_name, stats in project_data.items():
-            project_stats.append(ProjectUsageStats(
+            # Trusted data aggregated from already-validated sessions
+            project_stats.append(ProjectUsageStats.model_construct(
                 project_name=project_name,
-                total_tokens=stats['tokens'],
-                total_sessions=stats['sessions'],
-                total_interactions=stats['interactions'],
-                total_cost=stats['cost'],
-                models_used=list(stats['models_used']),
-                first_activity=stats['first_activity'],
-                last_activity=stats['last_activity']
+                total_tokens=TokenUsage.model_construct(
+                    input=stats.input,
+                    output=stats.output,
+                    cache_write=stats.cache_write,
+                    cache_read=stats.cache_read
+                ),
+                total_sessions=stats.sessions,
+                total_interactions=stats.interactions,
+                total_cost=stats.cost,
+                models_used=list(stats.models_used),
+                first_activity=stats.first_activity,
+                last_activity=stats.last_activity
             ))
 
         # Sort by total cost descending
         project_stats.sort(key=lambda x: x.total_cost, reverse=True)
 
-        return ProjectBreakdownReport(
+        report_tokens = TokenUsage()
+        for project in project_stats:
+            report_tokens += project.total_tokens
+
+        return ProjectBreakdownReport.model_construct(
             timeframe=timeframe,
             start_date=start_date,
             end_date=end_date,
-            project_stats=project_stats
+            project_stats=project_stats,
+            total_cost=sum((project.total_cost for project in project_stats), Decimal('0.0')),
+            total_tokens=report_tokens
         )
\ No newline at end of file
@@ -1,10 +1,55 @@
 """Session data models for OpenCode Monitor."""
 
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import date, datetime
+from functools import cached_property, lru_cache
+from typing import List, NamedTuple, Optional, Dict, Any
 from pathlib import Path
 from decimal import Decimal
-from pydantic import BaseModel, Field, computed_field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator, ConfigDict
+
+from ..config import scaled_cost_to_decimal
+
+
+@lru_cache(maxsize=256)
+def _resolve_pricing_key(model_id: str, pricing_keys: tuple) -> Optional[str]:
+    """Resolve a model id to its pricing key, memoizing the fuzzy scan.
+
+    Pure function of (model_id, pricing_keys), so repeated lookups for the
+    same model — every file in a session, every dashboard refresh — hit the
+    cache instead of re-normalizing and re-scanning the key list.
+    """
+    # Import here to avoid a circular import with utils.file_utils
+    from ..utils.file_utils import FileProcessor
+    normalized = FileProcessor._normalize_model_name(model_id)
+
+    if normalized in pricing_keys:
+        return normalized
+
+    # Try finding a matching key by prefix
+    for key in pricing_keys:
+        if normalized.startswith(key) or key.startswith(normalized):
+            # Check if they're similar (same model family)
+            # e.g., "claude-opus-4.5" matches "claude-opus-4.5-extended"
+            if key.replace('-extended', '') == normalized or \
+               normalized.replace('-extended', '') == key:
+                return key
+
+    return None
+
+
+def _pinned_cache_get(cache: Dict[int, tuple], pricing_data: Dict[str, Any]) -> Optional[Any]:
+    """Fetch a memoized per-pricing value, verifying the mapping identity.
+
+    Entries are (pricing_data, value) pairs stored under id(pricing_data).
+    Keeping the mapping referenced in the entry means its id cannot be
+    recycled by a later dict after garbage collection, and the `is` check
+    guards against a stale entry ever answering for a different mapping.
+    Store hits with: cache[id(pricing_data)] = (pricing_data, value).
+    """
+    entry = cache.get(id(pricing_data))
+    if entry is not None and entry[0] is pricing_data:
+        return entry[1]
+    return None
 
 
 class TokenUsage(BaseModel):
@@ -20,6 +65,24 @@ class TokenUsage(BaseModel):
         """Calculate total tokens."""
         return self.input + self.output + self.cache_write + self.cache_read
 
+    def as_dict(self) -> Dict[str, int]:
+        """Plain-dict view matching model_dump, skipping serializer dispatch."""
+        return {
+            'input': self.input,
+            'output': self.output,
+            'cache_write': self.cache_write,
+            'cache_read': self.cache_read,
+            'total': self.total,
+        }
+
+    def __iadd__(self, other: "TokenUsage") -> "TokenUsage":
+        """Accumulate another TokenUsage in place."""
+        self.input += other.input
+        self.output += other.output
+        self.cache_write += other.cache_write
+        self.cache_read += other.cache_read
+        return self
+
 
 class TimeData(BaseModel):
     """Model for timing information."""
@@ -60,27 +123,54 @@ class InteractionFile(BaseModel):
     time_data: Optional[TimeData] = Field(default=None)
     project_path: Optional[str] = Field(default=None, description="Project working directory from OpenCode")
     agent: Optional[str] = Field(default=None, description="Agent type (explore, plan, build, etc.)")
-    raw_data: Dict[str, Any] = Field(default_factory=dict)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Scaled cost per pricing-mapping identity, so report passes that touch
+    # the same file several times (table + JSON + CSV) compute it once
+    _cost_scaled_cache: Dict[int, tuple] = PrivateAttr(default_factory=dict)
+
     @field_validator('file_path')
     @classmethod
     def validate_file_path(cls, v):
         """Ensure file path is a Path object."""
         return Path(v) if not isinstance(v, Path) else v
 
+    @cached_property
+    def raw_data(self) -> Dict[str, Any]:
+        """Full parsed JSON payload, re-read from disk on first access.
+
+        Nothing on the hot paths reads the raw payload, so loading keeps
+        only the extracted fields instead of pinning a second copy of
+        every file's parsed dict in memory.
+        """
+        # Import here to avoid a circular import with utils.file_utils
+        from ..utils.file_utils import FileProcessor
+        return FileProcessor.load_json_file(self.file_path) or {}
+
     @computed_field
-    @property
+    @cached_property
     def file_name(self) -> str:
         """Get the file name."""
+        # Path.name re-parses the path on every access; compute it once
         return self.file_path.name
 
+    @cached_property
+    def mtime_ns(self) -> int:
+        """File modification time in integer nanoseconds, stat-ed once.
+
+        Interaction files are immutable once written and instances are
+        rebuilt on reload, so caching avoids a stat syscall per dashboard
+        read without ever serving a stale time. Hot loops compare this int
+        directly instead of building datetime objects.
+        """
+        return self.file_path.stat().st_mtime_ns
+
     @computed_field
-    @property
+    @cached_property
     def modification_time(self) -> datetime:
-        """Get file modification time."""
-        return datetime.fromtimestamp(self.file_path.stat().st_mtime)
+        """Get file modification time as a datetime."""
+        return datetime.fromtimestamp(self.mtime_ns / 1e9)
 
     @computed_field
     @property
@@ -90,55 +180,75 @@ class InteractionFile(BaseModel):
             return "Unknown"
         return Path(self.project_path).name if self.project_path else "Unknown"
 
+    def _resolve_pricing(self, pricing_data: Dict[str, Any]) -> Optional[Any]:
+        """Resolve pricing for this interaction with flexible model name matching.
+
+        Args:
+            pricing_data: Dictionary of model pricing information
+
+        Returns:
+            Pricing entry or None if no match found
+        """
+        # Exact match is the common case: one dict hit, no memo machinery
+        if self.model_id in pricing_data:
+            return pricing_data[self.model_id]
+
+        # Fall back to the memoized normalize/prefix scan
+        key = _resolve_pricing_key(self.model_id, tuple(pricing_data))
+        return pricing_data[key] if key is not None else None
+
     def calculate_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate cost for this interaction with flexible model name matching.
-        
+
         Args:
             pricing_data: Dictionary of model pricing information
-            
+
         Returns:
             Calculated cost in USD
         """
-        pricing = None
-        
-        # First try exact match
-        if self.model_id in pricing_data:
-            pricing = pricing_data[self.model_id]
-        else:
-            # Try prefix matching - extract base model name
-            # e.g., claude-opus-4.5-20251101 -> claude-opus-4.5
-            from ..utils.file_utils import FileProcessor
-            normalized = FileProcessor._normalize_model_name(self.model_id)
-            
-            if normalized in pricing_data:
-                pricing = pricing_data[normalized]
-            else:
-                # Try finding a matching key by prefix
-                for key in pricing_data.keys():
-                    if normalized.startswith(key) or key.startswith(normalized):
-                        # Check if they're similar (same model family)
-                        # e.g., "claude-opus-4.5" matches "claude-opus-4.5-extended"
-                        if key.replace('-extended', '') == normalized or \
-                           normalized.replace('-extended', '') == key:
-                            pricing = pricing_data[key]
-                            break
-        
-        if pricing is None:
-            return Decimal('0.0')
-        
-        cost = Decimal('0.0')
+        # Four integer multiplications on the precomputed scaled prices;
+        # a Decimal is only materialized once, at the return boundary
+        return scaled_cost_to_decimal(self.calculate_cost_scaled(pricing_data))
 
-        # Convert to cost per million tokens
-        million = Decimal('1000000')
+    def calculate_cost_scaled(self, pricing_data: Dict[str, Any]) -> int:
+        """Calculate cost as a scaled integer for hot aggregation loops.
 
-        cost += (Decimal(self.tokens.input) / million) * Decimal(str(pricing.input))
-        cost += (Decimal(self.tokens.output) / million) * Decimal(str(pricing.output))
-        cost += (Decimal(self.tokens.cache_write) / million) * Decimal(str(pricing.cache_write))
-        cost += (Decimal(self.tokens.cache_read) / million) * Decimal(str(pricing.cache_read))
+        Integer accumulation avoids per-operation Decimal overhead; convert
+        the accumulated value back to USD with config.scaled_cost_to_decimal.
 
+        Args:
+            pricing_data: Dictionary of model pricing information
+
+        Returns:
+            Cost in USD multiplied by COST_SCALE * 1_000_000
+        """
+        cached = _pinned_cache_get(self._cost_scaled_cache, pricing_data)
+        if cached is not None:
+            return cached
+
+        pricing = self._resolve_pricing(pricing_data)
+
+        if pricing is None:
+            cost = 0
+        else:
+            tokens = self.tokens
+            cost = (tokens.input * pricing.input_scaled
+                    + tokens.output * pricing.output_scaled
+                    + tokens.cache_write * pricing.cache_write_scaled
+                    + tokens.cache_read * pricing.cache_read_scaled)
+        self._cost_scaled_cache[id(pricing_data)] = (pricing_data, cost)
         return cost
 
 
+class _SessionAggregate(NamedTuple):
+    """Everything SessionData derives from its files, computed in one pass."""
+    tokens: "TokenUsage"
+    start_time: Optional[datetime]
+    end_time: Optional[datetime]
+    models: List[str]
+    processing_ms: int
+
+
 class SessionData(BaseModel):
     """Model for a complete OpenCode session."""
     session_id: str
@@ -149,48 +259,104 @@ class SessionData(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Sessions are immutable snapshots rebuilt on reload, so derived values
+    # (cached_property results and the cost cache below) never outlive the
+    # files they were computed from
+    _cost_cache: Dict[int, tuple] = PrivateAttr(default_factory=dict)
+    _breakdown_cache: Dict[int, tuple] = PrivateAttr(default_factory=dict)
+
     @field_validator('session_path')
     @classmethod
     def validate_session_path(cls, v):
         """Ensure session path is a Path object."""
         return Path(v) if not isinstance(v, Path) else v
 
+    @cached_property
+    def _aggregate(self) -> _SessionAggregate:
+        """Walk the file list once and derive all per-session aggregates.
+
+        The individual computed fields each used to traverse self.files
+        independently; sharing one pass keeps large sessions cheap.
+        """
+        input_total = output_total = cache_write_total = cache_read_total = 0
+        processing_ms = 0
+        min_created = None
+        max_completed = None
+        models = set()
+        add_model = models.add
+
+        # Compare the raw millisecond timestamps and only materialize
+        # datetime objects for the final min/max, not once per file
+        for file in self.files:
+            tokens = file.tokens
+            input_total += tokens.input
+            output_total += tokens.output
+            cache_write_total += tokens.cache_write
+            cache_read_total += tokens.cache_read
+            add_model(file.model_id)
+
+            time_data = file.time_data
+            if time_data:
+                created = time_data.created
+                if created is not None and (min_created is None or created < min_created):
+                    min_created = created
+                completed = time_data.completed
+                if completed is not None and (max_completed is None or completed > max_completed):
+                    max_completed = completed
+                if created is not None and completed is not None:
+                    processing_ms += completed - created
+
+        start_time = (
+            datetime.fromtimestamp(min_created / 1000) if min_created is not None else None
+        )
+        end_time = (
+            datetime.fromtimestamp(max_completed / 1000) if max_completed is not None else None
+        )
+
+        return _SessionAggregate(
+            tokens=TokenUsage.model_construct(
+                input=input_total,
+                output=output_total,
+                cache_write=cache_write_total,
+                cache_read=cache_read_total
+            ),
+            start_time=start_time,
+            end_time=end_time,
+            models=list(models),
+            processing_ms=processing_ms
+        )
+
     @computed_field
-    @property
+    @cached_property
     def models_used(self) -> List[str]:
         """Get list of unique models used in this session."""
-        return list(set(file.model_id for file in self.files))
+        return self._aggregate.models
 
     @computed_field
-    @property
+    @cached_property
     def total_tokens(self) -> TokenUsage:
         """Calculate total token usage for the session."""
-        total = TokenUsage()
-        for file in self.files:
-            total.input += file.tokens.input
-            total.output += file.tokens.output
-            total.cache_write += file.tokens.cache_write
-            total.cache_read += file.tokens.cache_read
-        return total
+        return self._aggregate.tokens
 
     @computed_field
-    @property
+    @cached_property
     def start_time(self) -> Optional[datetime]:
         """Get session start time (earliest file creation time)."""
-        times = [file.time_data.created_datetime for file in self.files
-                if file.time_data and file.time_data.created_datetime]
-        return min(times) if times else None
+        return self._aggregate.start_time
+
+    @cached_property
+    def start_date(self) -> Optional[date]:
+        """Get the calendar date of the session start, computed once."""
+        return self.start_time.date() if self.start_time else None
 
     @computed_field
-    @property
+    @cached_property
     def end_time(self) -> Optional[datetime]:
         """Get session end time (latest file completion time)."""
-        times = [file.time_data.completed_datetime for file in self.files
-                if file.time_data and file.time_data.completed_datetime]
-        return max(times) if times else None
+        return self._aggregate.end_time
 
     @computed_field
-    @property
+    @cached_property
     def duration_ms(self) -> Optional[int]:
         """Calculate total session duration in milliseconds."""
         if self.start_time and self.end_time:
@@ -213,46 +379,63 @@ class SessionData(BaseModel):
         return min(100.0, (self.duration_hours / max_hours) * 100.0)
 
     @computed_field
-    @property
+    @cached_property
     def total_processing_time_ms(self) -> int:
         """Calculate total processing time across all files."""
-        total = 0
-        for file in self.files:
-            if file.time_data and file.time_data.duration_ms:
-                total += file.time_data.duration_ms
-        return total
+        return self._aggregate.processing_ms
 
     def calculate_total_cost(self, pricing_data: Dict[str, Any]) -> Decimal:
         """Calculate total cost for the session."""
-        costs = [file.calculate_cost(pricing_data) for file in self.files]
-        return Decimal(sum(costs))
+        cached = _pinned_cache_get(self._cost_cache, pricing_data)
+        if cached is None:
+            total_scaled = 0
+            for file in self.files:
+                total_scaled += file.calculate_cost_scaled(pricing_data)
+            cached = scaled_cost_to_decimal(total_scaled)
+            self._cost_cache[id(pricing_data)] = (pricing_data, cached)
+        return cached
 
     def get_model_breakdown(self, pricing_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """Get breakdown of usage and cost by model."""
-        breakdown = {}
-
-        for model in self.models_used:
-            model_files = [f for f in self.files if f.model_id == model]
-            model_tokens = TokenUsage()
-            model_cost = Decimal('0.0')
-            model_duration_ms = 0
-
-            for file in model_files:
-                model_tokens.input += file.tokens.input
-                model_tokens.output += file.tokens.output
-                model_tokens.cache_write += file.tokens.cache_write
-                model_tokens.cache_read += file.tokens.cache_read
-                model_cost += file.calculate_cost(pricing_data)
-                if file.time_data and file.time_data.duration_ms:
-                    model_duration_ms += file.time_data.duration_ms
-
-            breakdown[model] = {
-                'files': len(model_files),
-                'tokens': model_tokens,
-                'cost': model_cost,
-                'duration_ms': model_duration_ms
-            }
+        cached = _pinned_cache_get(self._breakdown_cache, pricing_data)
+        if cached is not None:
+            return cached
 
+        # Group in one pass over the files instead of rescanning the whole
+        # list once per model
+        accumulators: Dict[str, list] = {}
+        for file in self.files:
+            acc = accumulators.get(file.model_id)
+            if acc is None:
+                # [files, input, output, cache_write, cache_read,
+                #  cost_scaled, duration_ms]
+                acc = accumulators[file.model_id] = [0, 0, 0, 0, 0, 0, 0]
+            tokens = file.tokens
+            acc[0] += 1
+            acc[1] += tokens.input
+            acc[2] += tokens.output
+            acc[3] += tokens.cache_write
+            acc[4] += tokens.cache_read
+            acc[5] += file.calculate_cost_scaled(pricing_data)
+            if file.time_data and file.time_data.duration_ms:
+                acc[6] += file.time_data.duration_ms
+
+        breakdown = {
+            model: {
+                'files': acc[0],
+                'tokens': TokenUsage.model_construct(
+                    input=acc[1],
+                    output=acc[2],
+                    cache_write=acc[3],
+                    cache_read=acc[4]
+                ),
+                'cost': scaled_cost_to_decimal(acc[5]),
+                'cost_scaled': acc[5],
+                'duration_ms': acc[6]
+            }
+            for model, acc in accumulators.items()
+        }
+        self._breakdown_cache[id(pricing_data)] = (pricing_data, breakdown)
         return breakdown
 
     @computed_field
@@ -267,26 +450,30 @@ class SessionData(BaseModel):
         return [file for file in self.files if file.tokens.total > 0]
 
     @computed_field
-    @property
+    @cached_property
     def project_name(self) -> str:
         """Get project name for this session based on most common project path."""
-        if not self.files:
-            return "Unknown"
-        
-        # Get project paths from files that have them
-        project_paths = [f.project_path for f in self.files if f.project_path]
-        
-        if not project_paths:
+        # Count paths and track the winner in a single pass (mixed paths are
+        # possible, so we still want the most common one)
+        counts: Dict[str, int] = {}
+        most_common_path = None
+        best_count = 0
+        for file in self.files:
+            path = file.project_path
+            if path:
+                count = counts.get(path, 0) + 1
+                counts[path] = count
+                if count > best_count:
+                    best_count = count
+                    most_common_path = path
+
+        if not most_common_path:
             return "Unknown"
-        
-        # Use the most common project path (in case there are mixed paths)
-        from collections import Counter
-        most_common_path = Counter(project_paths).most_common(1)[0][0]
-        
-        return Path(most_common_path).name if most_common_path else "Unknown"
+
+        return Path(most_common_path).name or "Unknown"
 
     @computed_field
-    @property
+    @cached_property
     def display_title(self) -> str:
         """Get display-friendly session title, with fallback to session ID."""
         if self.session_title:
@@ -23,12 +23,14 @@ class ExportService:
         self.export_dir = Path(export_dir)
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
-    def export_to_csv(self, data: List[Dict[str, Any]], filename: str,
+    def export_to_csv(self, data: Union[List[Dict[str, Any]], tuple], filename: str,
                      include_metadata: bool = True) -> str:
         """Export data to CSV format.
 
         Args:
-            data: List of dictionaries to export
+            data: Either a list of dictionaries, or a (fieldnames, rows)
+                pair where rows is an iterable of tuples in fieldname order
+                (the streaming form the report formatters produce)
             filename: Output filename (without extension)
             include_metadata: Whether to include metadata header
 
@@ -39,6 +41,14 @@ class ExportService:
             ValueError: If data is empty or invalid
             IOError: If file cannot be written
         """
+        # Normalize the streaming (fieldnames, rows) form; the metadata
+        # header needs a record count, so the rows are materialized here —
+        # as tuples they are still far lighter than per-row dicts
+        pretuple_fieldnames = None
+        if isinstance(data, tuple):
+            pretuple_fieldnames, rows = data
+            data = list(rows)
+
         if not data:
             raise ValueError("No data to export")
 
@@ -57,28 +67,40 @@ class ExportService:
                     csvfile.write(f"# Records: {len(data)}\n")
                     csvfile.write("#\n")
 
-                # Get all unique keys from the data
-                fieldnames = set()
-                for row in data:
-                    fieldnames.update(row.keys())
-                fieldnames = sorted(list(fieldnames))
-
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                # Write data rows, sanitizing values
-                for row in data:
-                    sanitized_row = {}
-                    for key in fieldnames:
-                        value = row.get(key)
-                        if value is None:
-                            sanitized_row[key] = ""
-                        elif isinstance(value, (list, dict)):
-                            # Convert complex types to string representation
-                            sanitized_row[key] = str(value)
-                        else:
-                            sanitized_row[key] = DataFormatter.sanitize_for_csv(value)
-                    writer.writerow(sanitized_row)
+                sanitize = DataFormatter.sanitize_for_csv
+
+                def sanitized_value(value):
+                    if value is None:
+                        return ""
+                    if isinstance(value, (list, dict)):
+                        # Convert complex types to string representation
+                        return str(value)
+                    return sanitize(value)
+
+                # Stream positional rows through csv.writer instead of
+                # rebuilding a sanitized dict per row for DictWriter; the
+                # column order is fixed up front and writerows drains the
+                # generator in one buffered pass
+                writer = csv.writer(csvfile)
+                if pretuple_fieldnames is not None:
+                    # Rows are already positional tuples in fieldname order
+                    writer.writerow(pretuple_fieldnames)
+                    writer.writerows(
+                        [sanitized_value(value) for value in row]
+                        for row in data
+                    )
+                else:
+                    # Get all unique keys from the data
+                    fieldnames = set()
+                    for row in data:
+                        fieldnames.update(row.keys())
+                    fieldnames = sorted(fieldnames)
+
+                    writer.writerow(fieldnames)
+                    writer.writerows(
+                        [sanitized_value(row.get(key)) for key in fieldnames]
+                        for row in data
+                    )
 
         except IOError as e:
             raise IOError(f"Failed to write CSV file: {e}")
@@ -1,9 +1,12 @@
 """Live monitoring service for OpenCode Monitor."""
 
+import os
+import queue
+import threading
 import time
-from datetime import datetime, timedelta
+from bisect import bisect_right
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from rich.live import Live
 from rich.console import Console
 
@@ -14,6 +17,11 @@ from ..ui.dashboard import DashboardUI
 from ..config import ModelPricing
 from .session_grouper import SessionGrouper
 
+# Activity classification: seconds-since-last-activity upper bounds and the
+# label for each bucket (the last label catches everything beyond the bounds)
+_ACTIVITY_THRESHOLDS = (60, 300, 1800)
+_ACTIVITY_LABELS = ('active', 'recent', 'idle', 'inactive')
+
 
 class LiveMonitor:
     """Service for live monitoring of OpenCode sessions."""
@@ -29,6 +37,101 @@ class LiveMonitor:
         self.console = console or Console()
         self.dashboard_ui = DashboardUI(console)
         self.session_grouper = SessionGrouper()
+        # Flat lookup covering exact and normalized pricing keys, built once
+        # so per-refresh lookups are a single dict hit instead of a miss
+        # followed by the fuzzy resolution scan
+        self._pricing_lookup: Dict[str, ModelPricing] = dict(pricing_data)
+        for key, pricing in pricing_data.items():
+            self._pricing_lookup.setdefault(FileProcessor._normalize_model_name(key), pricing)
+        # Incremental-reload caches: parsed interactions keyed by file path
+        # and assembled sessions keyed by session id, both guarded by
+        # (mtime_ns, size) signatures so only changed files are re-parsed
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], Optional[InteractionFile]]] = {}
+        self._session_cache: Dict[str, Tuple[tuple, SessionData]] = {}
+
+    def _load_sessions_incremental(self, base_path: str, limit: int = 50) -> List[SessionData]:
+        """Load sessions, re-parsing only files that changed since last call.
+
+        The monitor loop re-reads every session each tick; for an active
+        session this meant re-parsing hundreds of unchanged JSON files every
+        refresh. Cached parses are reused while a file's (mtime_ns, size)
+        signature is stable, and an unchanged session returns the previous
+        SessionData object so its cached aggregates survive too.
+
+        Args:
+            base_path: Path to directory containing sessions
+            limit: Maximum number of sessions to load
+
+        Returns:
+            List of SessionData objects
+        """
+        session_dirs = FileProcessor.find_session_directories(base_path)[:limit]
+
+        sessions = []
+        for session_dir in session_dirs:
+            session = self._load_session_incremental(session_dir)
+            if session:
+                sessions.append(session)
+        return sessions
+
+    def _load_session_incremental(self, session_path: Path) -> Optional[SessionData]:
+        """Load one session directory through the signature caches."""
+        entries = []
+        try:
+            with os.scandir(session_path) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            return None
+
+        if not entries:
+            return None
+
+        session_id = session_path.name
+        signature = tuple(sorted(entries))
+        cached = self._session_cache.get(session_id)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        # Newest first, matching FileProcessor.find_json_files ordering
+        entries.sort(key=lambda item: item[1], reverse=True)
+
+        interaction_files = []
+        for path, mtime_ns, size in entries:
+            file_sig = (mtime_ns, size)
+            cached_file = self._file_cache.get(path)
+            if cached_file and cached_file[0] == file_sig:
+                interaction = cached_file[1]
+            else:
+                interaction = FileProcessor.parse_interaction_file(Path(path), session_id)
+                # Filter out interactions with zero token usage, caching the
+                # verdict so the file isn't re-parsed next tick
+                if interaction and interaction.tokens.total == 0:
+                    interaction = None
+                self._file_cache[path] = (file_sig, interaction)
+            if interaction:
+                interaction_files.append(interaction)
+
+        if not interaction_files:
+            return None
+
+        session_title = FileProcessor.find_session_title(session_id)
+        sorted_files = sorted(
+            interaction_files,
+            key=lambda f: f.time_data.created if f.time_data and f.time_data.created else 0
+        )
+
+        session = SessionData(
+            session_id=session_id,
+            session_path=session_path,
+            files=interaction_files,
+            session_title=session_title,
+            agent=sorted_files[0].agent if sorted_files else None
+        )
+        self._session_cache[session_id] = (signature, session)
+        return session
 
     def start_monitoring(self, base_path: str, refresh_interval: int = 5):
         """Start live monitoring of the most recent workflow (main session + sub-agents).
@@ -39,7 +142,7 @@ class LiveMonitor:
         """
         try:
             # Load recent sessions and group into workflows
-            sessions = FileProcessor.load_all_sessions(base_path, limit=50)
+            sessions = self._load_sessions_incremental(base_path, limit=50)
             if not sessions:
                 self.console.print(f"[red]No sessions found in {base_path}[/red]")
                 return
@@ -51,7 +154,7 @@ class LiveMonitor:
 
             # Get the most recent workflow
             current_workflow = workflows[0]
-            tracked_session_ids = set(s.session_id for s in current_workflow.all_sessions)
+            tracked_session_ids = {s.session_id for s in current_workflow.all_sessions}
 
             self.console.print(f"[green]Starting live monitoring of workflow: {current_workflow.main_session.session_id}[/green]")
             if current_workflow.has_sub_agents:
@@ -59,44 +162,93 @@ class LiveMonitor:
             self.console.print(f"[cyan]Update interval: {refresh_interval} seconds[/cyan]")
             self.console.print("[dim]Press Ctrl+C to exit[/dim]\n")
 
-            # Start live monitoring
-            with Live(
-                self._generate_workflow_dashboard(current_workflow),
-                refresh_per_second=1/refresh_interval,
-                console=self.console
-            ) as live:
-                while True:
-                    # Reload all sessions and re-group
-                    sessions = FileProcessor.load_all_sessions(base_path, limit=50)
+            # Scan and parse on a background thread so a slow filesystem
+            # never stalls the UI refresh; the queue holds only the newest
+            # snapshot (drop-old semantics)
+            updates: queue.Queue = queue.Queue(maxsize=1)
+            stop_scanning = threading.Event()
+
+            def _scan_loop():
+                while not stop_scanning.is_set():
+                    sessions = self._load_sessions_incremental(base_path, limit=50)
                     workflows = self.session_grouper.group_sessions(sessions)
+                    try:
+                        updates.put_nowait(workflows)
+                    except queue.Full:
+                        try:
+                            updates.get_nowait()
+                        except queue.Empty:
+                            pass
+                        try:
+                            updates.put_nowait(workflows)
+                        except queue.Full:
+                            pass
+                    stop_scanning.wait(refresh_interval)
+
+            scanner = threading.Thread(target=_scan_loop, daemon=True)
+            scanner.start()
 
-                    if workflows:
-                        # Check if a new workflow started (different main session)
-                        new_workflow = workflows[0]
-                        if new_workflow.workflow_id != current_workflow.workflow_id:
-                            # Check if the new main session is not a sub-agent of our current workflow
-                            if new_workflow.main_session.session_id not in tracked_session_ids:
+            # Start live monitoring
+            try:
+                with Live(
+                    self._generate_workflow_dashboard(current_workflow),
+                    refresh_per_second=1/refresh_interval,
+                    console=self.console
+                ) as live:
+                    while True:
+                        # Wait for the next snapshot from the scanner thread
+                        try:
+                            workflows = updates.get(timeout=refresh_interval)
+                        except queue.Empty:
+                            continue
+
+                        if workflows:
+                            # Check if a new workflow started (different main session)
+                            new_workflow = workflows[0]
+                            if new_workflow.workflow_id != current_workflow.workflow_id:
+                                # Check if the new main session is not a sub-agent of our current workflow
+                                if new_workflow.main_session.session_id not in tracked_session_ids:
+                                    current_workflow = new_workflow
+                                    tracked_session_ids = {s.session_id for s in current_workflow.all_sessions}
+                                    self.console.print(f"\n[yellow]New workflow detected: {current_workflow.main_session.session_id}[/yellow]")
+                            else:
+                                # Same workflow, update it
                                 current_workflow = new_workflow
-                                tracked_session_ids = set(s.session_id for s in current_workflow.all_sessions)
-                                self.console.print(f"\n[yellow]New workflow detected: {current_workflow.main_session.session_id}[/yellow]")
-                        else:
-                            # Same workflow, update it
-                            current_workflow = new_workflow
-                            # Check for new sub-agents
-                            new_ids = set(s.session_id for s in current_workflow.all_sessions)
-                            new_subs = new_ids - tracked_session_ids
-                            if new_subs:
-                                for sub_id in new_subs:
-                                    self.console.print(f"\n[cyan]New sub-agent detected: {sub_id}[/cyan]")
-                                tracked_session_ids = new_ids
-
-                    # Update dashboard
-                    live.update(self._generate_workflow_dashboard(current_workflow))
-                    time.sleep(refresh_interval)
+                                # Check for new sub-agents
+                                new_ids = {s.session_id for s in current_workflow.all_sessions}
+                                new_subs = new_ids - tracked_session_ids
+                                if new_subs:
+                                    for sub_id in new_subs:
+                                        self.console.print(f"\n[cyan]New sub-agent detected: {sub_id}[/cyan]")
+                                    tracked_session_ids = new_ids
+
+                        # Redraw every tick: the clock header and the
+                        # session-time panel advance even when the token
+                        # counts do not, and the per-panel caches make an
+                        # idle rebuild cheap anyway
+                        live.update(self._generate_workflow_dashboard(current_workflow))
+            finally:
+                stop_scanning.set()
 
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Live monitoring stopped.[/yellow]")
 
+    @staticmethod
+    def _most_recent_file(files: List[InteractionFile]) -> Optional[InteractionFile]:
+        """Find the most recently modified file with an explicit loop.
+
+        Avoids the per-item lambda call that max(files, key=...) pays on
+        every dashboard refresh.
+        """
+        recent_file = None
+        recent_mtime = -1
+        for f in files:
+            mtime = f.mtime_ns
+            if mtime > recent_mtime:
+                recent_file = f
+                recent_mtime = mtime
+        return recent_file
+
     def _generate_dashboard(self, session: SessionData):
         """Generate dashboard layout for the session.
 
@@ -107,9 +259,7 @@ class LiveMonitor:
             Rich layout for the dashboard
         """
         # Get the most recent file
-        recent_file = None
-        if session.files:
-            recent_file = max(session.files, key=lambda f: f.modification_time)
+        recent_file = self._most_recent_file(session.files)
 
         # Calculate output rate (tokens per second over last 5 minutes)
         output_rate = self._calculate_output_rate(session)
@@ -118,8 +268,8 @@ class LiveMonitor:
         quota = None
         context_window = 200000  # Default
 
-        if recent_file and recent_file.model_id in self.pricing_data:
-            model_pricing = self.pricing_data[recent_file.model_id]
+        model_pricing = self._pricing_lookup.get(recent_file.model_id) if recent_file else None
+        if model_pricing:
             quota = model_pricing.session_quota
             context_window = model_pricing.context_window
 
@@ -147,9 +297,7 @@ class LiveMonitor:
             all_files.extend(session.files)
 
         # Get the most recent file across all sessions
-        recent_file = None
-        if all_files:
-            recent_file = max(all_files, key=lambda f: f.modification_time)
+        recent_file = self._most_recent_file(all_files)
 
         # Calculate output rate across entire workflow
         output_rate = self._calculate_workflow_output_rate(workflow)
@@ -158,8 +306,8 @@ class LiveMonitor:
         quota = None
         context_window = 200000  # Default
 
-        if recent_file and recent_file.model_id in self.pricing_data:
-            model_pricing = self.pricing_data[recent_file.model_id]
+        model_pricing = self._pricing_lookup.get(recent_file.model_id) if recent_file else None
+        if model_pricing:
             quota = model_pricing.session_quota
             context_window = model_pricing.context_window
 
@@ -189,40 +337,7 @@ class LiveMonitor:
         for session in workflow.all_sessions:
             all_files.extend(session.files)
 
-        if not all_files:
-            return 0.0
-
-        # Calculate the cutoff time (5 minutes ago)
-        cutoff_time = datetime.now() - timedelta(minutes=5)
-
-        # Filter interactions from the last 5 minutes
-        recent_interactions = [
-            f for f in all_files
-            if f.modification_time >= cutoff_time
-        ]
-
-        if not recent_interactions:
-            return 0.0
-
-        # Sum output tokens from recent interactions
-        total_output_tokens = sum(f.tokens.output for f in recent_interactions)
-
-        if total_output_tokens == 0:
-            return 0.0
-
-        # Sum active processing time (duration_ms) from recent interactions
-        total_duration_ms = 0
-        for f in recent_interactions:
-            if f.time_data and f.time_data.duration_ms:
-                total_duration_ms += f.time_data.duration_ms
-
-        # Convert to seconds
-        total_duration_seconds = total_duration_ms / 1000
-
-        if total_duration_seconds > 0:
-            return total_output_tokens / total_duration_seconds
-
-        return 0.0
+        return self._output_rate_from_files(all_files)
 
     def _calculate_output_rate(self, session: SessionData) -> float:
         """Calculate output token rate over the last 5 minutes of activity.
@@ -233,41 +348,36 @@ class LiveMonitor:
         Returns:
             Output tokens per second over the last 5 minutes
         """
-        if not session.files:
-            return 0.0
-
-        # Calculate the cutoff time (5 minutes ago)
-        cutoff_time = datetime.now() - timedelta(minutes=5)
+        return self._output_rate_from_files(session.files)
 
-        # Filter interactions from the last 5 minutes
-        recent_interactions = [
-            f for f in session.files
-            if f.modification_time >= cutoff_time
-        ]
+    @staticmethod
+    def _output_rate_from_files(files: List[InteractionFile]) -> float:
+        """Compute output tokens per second over the last 5 minutes of files.
 
-        if not recent_interactions:
+        Runs every refresh, so the cutoff filter and both sums happen in a
+        single loop with one modification_time read per file instead of
+        building an intermediate list and re-reading it per sum.
+        """
+        if not files:
             return 0.0
 
-        # Sum output tokens from recent interactions
-        total_output_tokens = sum(f.tokens.output for f in recent_interactions)
-
-        # If no output tokens, return 0
-        if total_output_tokens == 0:
-            return 0.0
+        # Cutoff 5 minutes ago, as integer nanoseconds: the loop compares
+        # plain ints rather than constructing datetimes per file
+        cutoff_ns = time.time_ns() - 300 * 1_000_000_000
 
-        # Sum active processing time (duration_ms) from recent interactions
+        total_output_tokens = 0
         total_duration_ms = 0
-        for f in recent_interactions:
-            if f.time_data and f.time_data.duration_ms:
-                total_duration_ms += f.time_data.duration_ms
-
-        # Convert to seconds
-        total_duration_seconds = total_duration_ms / 1000
-
-        if total_duration_seconds > 0:
-            return total_output_tokens / total_duration_seconds
+        for f in files:
+            if f.mtime_ns >= cutoff_ns:
+                total_output_tokens += f.tokens.output
+                time_data = f.time_data
+                if time_data and time_data.duration_ms:
+                    total_duration_ms += time_data.duration_ms
+
+        if total_output_tokens == 0 or total_duration_ms <= 0:
+            return 0.0
 
-        return 0.0
+        return total_output_tokens / (total_duration_ms / 1000)
 
     def get_session_status(self, base_path: str) -> Dict[str, Any]:
         """Get current status of the most recent session.
@@ -285,26 +395,20 @@ class LiveMonitor:
                 'message': 'No sessions found'
             }
 
-        recent_file = None
-        if recent_session.files:
-            recent_file = max(recent_session.files, key=lambda f: f.modification_time)
+        recent_file = self._most_recent_file(recent_session.files)
 
         # Calculate how long ago the last activity was
         last_activity = None
         if recent_file:
-            last_activity = time.time() - recent_file.modification_time.timestamp()
+            last_activity = time.time() - recent_file.mtime_ns / 1e9
 
-        # Determine activity status
+        # Determine activity status via a threshold bisection instead of an
+        # if/elif ladder
         activity_status = 'unknown'
         if last_activity is not None:
-            if last_activity < 60:  # Less than 1 minute
-                activity_status = 'active'
-            elif last_activity < 300:  # Less than 5 minutes
-                activity_status = 'recent'
-            elif last_activity < 1800:  # Less than 30 minutes
-                activity_status = 'idle'
-            else:
-                activity_status = 'inactive'
+            activity_status = _ACTIVITY_LABELS[
+                bisect_right(_ACTIVITY_THRESHOLDS, last_activity)
+            ]
 
         return {
             'status': 'found',
@@ -336,9 +440,7 @@ class LiveMonitor:
         if not recent_session:
             return None
 
-        recent_file = None
-        if recent_session.files:
-            recent_file = max(recent_session.files, key=lambda f: f.modification_time)
+        recent_file = self._most_recent_file(recent_session.files)
 
         return {
             'timestamp': time.time(),
@@ -369,14 +471,14 @@ class LiveMonitor:
         Returns:
             Context usage information
         """
-        if interaction_file.model_id not in self.pricing_data:
+        model_pricing = self._pricing_lookup.get(interaction_file.model_id)
+        if model_pricing is None:
             return {
                 'context_size': 0,
                 'context_window': 200000,
                 'usage_percentage': 0.0
             }
 
-        model_pricing = self.pricing_data[interaction_file.model_id]
         context_window = model_pricing.context_window
 
         # Context size = input + cache read + cache write
@@ -391,7 +493,7 @@ class LiveMonitor:
         return {
             'context_size': context_size,
             'context_window': context_window,
-            'usage_percentage': min(100.0, usage_percentage)
+            'usage_percentage': usage_percentage if usage_percentage < 100.0 else 100.0
         }
 
     def validate_monitoring_setup(self, base_path: str) -> Dict[str, Any]:
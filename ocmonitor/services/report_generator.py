@@ -1,11 +1,15 @@
 """Report generation service for OpenCode Monitor."""
 
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from datetime import date
 from decimal import Decimal
 from collections import defaultdict
+from itertools import chain
+from functools import lru_cache
+from operator import itemgetter
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
 from ..models.session import SessionData
 from ..models.analytics import DailyUsage, WeeklyUsage, MonthlyUsage, ModelBreakdownReport, ProjectBreakdownReport
@@ -13,7 +17,19 @@ from ..models.workflow import SessionWorkflow
 from ..ui.tables import TableFormatter
 from ..services.session_analyzer import SessionAnalyzer
 from ..services.session_grouper import SessionGrouper
-from ..config import ModelPricing
+from ..utils.time_utils import TimeUtils, WEEKDAY_NAMES
+from ..config import ModelPricing, scaled_cost_to_decimal
+
+
+@lru_cache(maxsize=4096)
+def _iso(value) -> Optional[str]:
+    """Memoized isoformat, tolerating None.
+
+    Weekly and monthly rollups repeat the same boundary dates across many
+    rows, and models/projects share first/last activity timestamps, so the
+    second occurrence of a value is a dict lookup instead of a format call.
+    """
+    return value.isoformat() if value is not None else None
 
 
 class ReportGenerator:
@@ -29,44 +45,142 @@ class ReportGenerator:
         self.analyzer = analyzer
         self.table_formatter = TableFormatter(console)
         self.console = console or Console()
+        # Parsed sessions per (base_path, limit): a CLI invocation that emits
+        # several reports should only read the session files from disk once
+        self._sessions_cache: Dict[Tuple[str, Optional[int]], List[SessionData]] = {}
+        self._breakdowns_cache: Dict[Tuple[int, int], tuple] = {}
+        self._filtered_cache: Dict[tuple, tuple] = {}
 
-    def _get_model_breakdown_for_sessions(self, sessions: List[SessionData]) -> List[Dict[str, Any]]:
-        """Calculate per-model breakdown for a set of sessions.
+    def _analyze_all_cached(self, base_path: str, limit: Optional[int] = None) -> List[SessionData]:
+        """Load and analyze sessions, caching per (base_path, limit).
+
+        Args:
+            base_path: Path to directory containing sessions
+            limit: Maximum number of sessions to analyze
+
+        Returns:
+            List of SessionData objects
+        """
+        cache_key = (base_path, limit)
+        sessions = self._sessions_cache.get(cache_key)
+        if sessions is None:
+            sessions = self.analyzer.analyze_all_sessions(base_path, limit)
+            self._sessions_cache[cache_key] = sessions
+        return sessions
+
+    def _sessions_for_range(self, sessions: List[SessionData],
+                            start_date: Optional[date],
+                            end_date: Optional[date]) -> List[SessionData]:
+        """Filter sessions to a date range, caching per (list, range).
+
+        Overlapping reports in one run (a dashboard emitting daily, weekly
+        and monthly views of the same month or year) reuse the filtered
+        list instead of re-filtering the full session list each time.
+
+        Args:
+            sessions: List of sessions to filter
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+
+        Returns:
+            Filtered list of sessions
+        """
+        cache_key = (id(sessions), start_date, end_date)
+        cached = self._filtered_cache.get(cache_key)
+        # Keep the source list in the entry so its id cannot be recycled
+        if cached is None or cached[0] is not sessions:
+            filtered = self.analyzer.filter_sessions_by_date(sessions, start_date, end_date)
+            cached = (sessions, filtered)
+            self._filtered_cache[cache_key] = cached
+        return cached[1]
+
+    def _breakdowns_for(self, sessions: List[SessionData], week_start_day: int = 0) -> tuple:
+        """Get (daily, weekly, monthly) breakdowns for a session list.
+
+        All three layers come from one fused pass over the sessions and are
+        cached per session list, so consecutive daily/weekly/monthly reports
+        in the same run share the intermediate instead of regrouping.
 
         Args:
             sessions: List of sessions to analyze
+            week_start_day: Day to start week on (0=Monday, 6=Sunday)
 
         Returns:
-            List of model breakdown dicts sorted by cost descending
+            Tuple of (daily, weekly, monthly) breakdown lists
         """
-        model_data: Dict[str, Dict[str, Any]] = {}
+        cache_key = (id(sessions), week_start_day)
+        cached = self._breakdowns_cache.get(cache_key)
+        # Keep the sessions list in the entry so its id cannot be recycled
+        if cached is None or cached[0] is not sessions:
+            cached = (sessions, self.analyzer.create_all_breakdowns(sessions, week_start_day))
+            self._breakdowns_cache[cache_key] = cached
+        return cached[1]
+
+    @staticmethod
+    def _format_models_display(models_used: List[str], width: int = 40) -> str:
+        """Join model names, truncating to the display width.
+
+        Stops accumulating once the joined text exceeds the width instead of
+        joining the full list first and slicing, so projects with many models
+        never allocate the untruncated string.
+
+        Args:
+            models_used: Model names to join
+            width: Maximum display width
+
+        Returns:
+            Comma-joined model names, truncated with an ellipsis if needed
+        """
+        parts = []
+        length = 0
+        for model in models_used:
+            length += len(model) + (2 if parts else 0)
+            parts.append(model)
+            if length > width:
+                return ", ".join(parts)[:width - 3] + "..."
+        return ", ".join(parts)
+
+    def _get_model_breakdown_for_sessions(self, sessions: Iterable[SessionData]) -> List[Dict[str, Any]]:
+        """Calculate per-model breakdown for a set of sessions.
+
+        Args:
+            sessions: Iterable of sessions to analyze
 
+        Returns:
+            List of model breakdown dicts sorted by cost descending
+        """
+        # Accumulator slots: [session_ids, interactions, tokens, cost_scaled].
+        # Index access on a list is cheaper than the string-keyed dict lookups
+        # a dict-of-dicts accumulator would do on every merge step; the cost
+        # stays a scaled int and becomes a Decimal once at the end.
+        model_data: Dict[str, list] = defaultdict(lambda: [set(), 0, 0, 0])
+
+        # Merge the per-session breakdowns, which SessionData caches per
+        # pricing mapping. Daily, weekly and monthly breakdown views over
+        # the same sessions then aggregate each session's files only once
+        # instead of re-walking and re-costing them per timeframe level.
+        pricing_data = self.analyzer.pricing_data
         for session in sessions:
-            for file in session.files:
-                model = file.model_id
-                if model not in model_data:
-                    model_data[model] = {
-                        'sessions': set(),
-                        'interactions': 0,
-                        'tokens': 0,
-                        'cost': Decimal('0.0')
-                    }
-                model_data[model]['sessions'].add(session.session_id)
-                model_data[model]['interactions'] += 1
-                model_data[model]['tokens'] += file.tokens.total
-                model_data[model]['cost'] += file.calculate_cost(self.analyzer.pricing_data)
+            session_id = session.session_id
+            for model, stats in session.get_model_breakdown(pricing_data).items():
+                data = model_data[model]
+                data[0].add(session_id)
+                data[1] += stats['files']
+                data[2] += stats['tokens'].total
+                data[3] += stats['cost_scaled']
 
         results = []
         for model, data in model_data.items():
             results.append({
                 'model': model,
-                'sessions': len(data['sessions']),
-                'interactions': data['interactions'],
-                'tokens': data['tokens'],
-                'cost': data['cost']
+                'sessions': len(data[0]),
+                'interactions': data[1],
+                'tokens': data[2],
+                'cost': scaled_cost_to_decimal(data[3])
             })
 
-        return sorted(results, key=lambda x: x['cost'], reverse=True)
+        # itemgetter is a C-level key function, cheaper than a lambda per item
+        return sorted(results, key=itemgetter('cost'), reverse=True)
 
     def generate_single_session_report(self, session_path: str, output_format: str = "table") -> Optional[Dict[str, Any]]:
         """Generate report for a single session.
@@ -116,7 +230,7 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path, limit)
+        sessions = self._analyze_all_cached(base_path, limit)
         summary = self.analyzer.get_sessions_summary(sessions)
 
         report_data = {
@@ -149,18 +263,17 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._analyze_all_cached(base_path)
 
         # Apply month filter if specified
         if month:
-            from ..utils.time_utils import TimeUtils
             month_data = TimeUtils.parse_month_string(month)
             if month_data:
                 year, month_num = month_data
                 start_date, end_date = TimeUtils.get_month_range(year, month_num)
-                sessions = self.analyzer.filter_sessions_by_date(sessions, start_date, end_date)
+                sessions = self._sessions_for_range(sessions, start_date, end_date)
 
-        daily_usage = self.analyzer.create_daily_breakdown(sessions)
+        daily_usage = self._breakdowns_for(sessions)[0]
 
         report_data = {
             'type': 'daily_breakdown',
@@ -192,15 +305,14 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._analyze_all_cached(base_path)
 
         # Apply year filter if specified
         if year:
-            from ..utils.time_utils import TimeUtils
             start_date, end_date = TimeUtils.get_year_range(year)
-            sessions = self.analyzer.filter_sessions_by_date(sessions, start_date, end_date)
+            sessions = self._sessions_for_range(sessions, start_date, end_date)
 
-        weekly_usage = self.analyzer.create_weekly_breakdown(sessions, week_start_day)
+        weekly_usage = self._breakdowns_for(sessions, week_start_day)[1]
 
         report_data = {
             'type': 'weekly_breakdown',
@@ -229,15 +341,14 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._analyze_all_cached(base_path)
 
         # Apply year filter if specified
         if year:
-            from ..utils.time_utils import TimeUtils
             start_date, end_date = TimeUtils.get_year_range(year)
-            sessions = self.analyzer.filter_sessions_by_date(sessions, start_date, end_date)
+            sessions = self._sessions_for_range(sessions, start_date, end_date)
 
-        monthly_usage = self.analyzer.create_monthly_breakdown(sessions)
+        monthly_usage = self._breakdowns_for(sessions)[2]
 
         report_data = {
             'type': 'monthly_breakdown',
@@ -269,10 +380,9 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._analyze_all_cached(base_path)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
         parsed_start_date = TimeUtils.parse_date_string(start_date) if start_date else None
         parsed_end_date = TimeUtils.parse_date_string(end_date) if end_date else None
 
@@ -314,10 +424,9 @@ class ReportGenerator:
         Returns:
             Report data
         """
-        sessions = self.analyzer.analyze_all_sessions(base_path)
+        sessions = self._analyze_all_cached(base_path)
 
         # Parse date filters
-        from ..utils.time_utils import TimeUtils
         parsed_start_date = TimeUtils.parse_date_string(start_date) if start_date else None
         parsed_end_date = TimeUtils.parse_date_string(end_date) if end_date else None
 
@@ -344,15 +453,59 @@ class ReportGenerator:
 
         return report_data
 
+    def generate_reports_bundle(self, base_path: str,
+                                specs: List[Dict[str, Any]]) -> List[Any]:
+        """Generate several reports over one shared session load.
+
+        Each spec names a report and its keyword arguments, e.g.
+        ``{'report': 'daily', 'output_format': 'json'}``. The sessions are
+        loaded and parsed once up front; every report then runs against the
+        warm session, breakdown and cost caches, so a table + json + csv
+        bundle pays the file-scan cost a single time. Reports run
+        sequentially: the remaining per-report work is pure-Python
+        aggregation that would not overlap under the GIL, and interleaving
+        Rich console output from worker threads is not safe.
+
+        Args:
+            base_path: Path to directory containing sessions
+            specs: List of report specs, each with a 'report' key naming
+                one of sessions/daily/weekly/monthly/models/projects plus
+                keyword arguments for that generate_* method
+
+        Returns:
+            List of report results in spec order
+        """
+        generators = {
+            'sessions': self.generate_sessions_summary_report,
+            'daily': self.generate_daily_report,
+            'weekly': self.generate_weekly_report,
+            'monthly': self.generate_monthly_report,
+            'models': self.generate_models_report,
+            'projects': self.generate_projects_report,
+        }
+
+        # Warm the session cache once for the whole bundle
+        self._analyze_all_cached(base_path)
+
+        results = []
+        for spec in specs:
+            kwargs = dict(spec)
+            report = kwargs.pop('report')
+            if report not in generators:
+                raise ValueError(f"Unknown report type: {report}")
+            results.append(generators[report](base_path, **kwargs))
+        return results
+
     # Table display methods
     def _display_single_session_table(self, session: SessionData, stats: Dict[str, Any], health: Dict[str, Any]):
         """Display single session report as table."""
+        pricing_data = self.analyzer.pricing_data
         # Create session details table
-        table = self.table_formatter.create_session_table(session, self.analyzer.pricing_data)
+        table = self.table_formatter.create_session_table(session, pricing_data)
         self.console.print(table)
 
         # Create summary panel
-        summary_panel = self.table_formatter.create_summary_panel([session], self.analyzer.pricing_data)
+        summary_panel = self.table_formatter.create_summary_panel([session], pricing_data)
         self.console.print(summary_panel)
 
         # Show health warnings if any
@@ -363,15 +516,16 @@ class ReportGenerator:
 
     def _display_sessions_summary_table(self, sessions: List[SessionData], summary: Dict[str, Any]):
         """Display sessions summary as table."""
-        table = self.table_formatter.create_sessions_table(sessions, self.analyzer.pricing_data)
+        pricing_data = self.analyzer.pricing_data
+        table = self.table_formatter.create_sessions_table(sessions, pricing_data)
         self.console.print(table)
 
-        summary_panel = self.table_formatter.create_summary_panel(sessions, self.analyzer.pricing_data)
+        summary_panel = self.table_formatter.create_summary_panel(sessions, pricing_data)
         self.console.print(summary_panel)
 
     def _display_workflow_sessions_table(self, sessions: List[SessionData], summary: Dict[str, Any]):
         """Display sessions grouped by workflow."""
-        from rich.table import Table
+        pricing_data = self.analyzer.pricing_data
 
         # Group sessions into workflows
         grouper = SessionGrouper()
@@ -395,7 +549,7 @@ class ReportGenerator:
 
         # Display oldest first so most recent is at the bottom (matching --no-group behavior)
         for workflow in reversed(workflows):
-            workflow_cost = workflow.calculate_total_cost(self.analyzer.pricing_data)
+            workflow_cost = workflow.calculate_total_cost(pricing_data)
 
             # Workflow header row (if has sub-agents, show as group)
             if workflow.has_sub_agents:
@@ -431,7 +585,7 @@ class ReportGenerator:
 
                 # Main session row
                 main = workflow.main_session
-                main_cost = main.calculate_total_cost(self.analyzer.pricing_data)
+                main_cost = main.calculate_total_cost(pricing_data)
                 main_title = main.display_title
                 if len(main_title) > 38:
                     main_title = main_title[:35] + "..."
@@ -461,7 +615,7 @@ class ReportGenerator:
                 for i, sub in enumerate(workflow.sub_agent_sessions):
                     is_last = i == len(workflow.sub_agent_sessions) - 1
                     prefix = "  └─" if is_last else "  ├─"
-                    sub_cost = sub.calculate_total_cost(self.analyzer.pricing_data)
+                    sub_cost = sub.calculate_total_cost(pricing_data)
                     sub_title = sub.display_title
                     if len(sub_title) > 38:
                         sub_title = sub_title[:35] + "..."
@@ -489,7 +643,7 @@ class ReportGenerator:
             else:
                 # Single session (no sub-agents)
                 main = workflow.main_session
-                main_cost = main.calculate_total_cost(self.analyzer.pricing_data)
+                main_cost = main.calculate_total_cost(pricing_data)
                 title = main.display_title
                 if len(title) > 42:
                     title = title[:39] + "..."
@@ -522,19 +676,18 @@ class ReportGenerator:
         # Summary panel
         total_workflows = len(workflows)
         total_with_subs = sum(1 for w in workflows if w.has_sub_agents)
-        summary_panel = self.table_formatter.create_summary_panel(sessions, self.analyzer.pricing_data)
+        summary_panel = self.table_formatter.create_summary_panel(sessions, pricing_data)
         self.console.print(summary_panel)
 
         # Additional workflow info
         if total_with_subs > 0:
-            from rich.panel import Panel
             workflow_info = f"{total_workflows} workflows ({total_with_subs} with sub-agents)"
             self.console.print(Panel(workflow_info, title="Workflow Summary", border_style="cyan"))
 
     def _display_daily_breakdown_table(self, daily_usage: List[DailyUsage], breakdown: bool = False):
         """Display daily breakdown as table."""
+        pricing_data = self.analyzer.pricing_data
         if breakdown:
-            from rich.table import Table
             table = Table(
                 title="Daily Usage Breakdown",
                 show_header=True,
@@ -548,30 +701,37 @@ class ReportGenerator:
             table.add_column("Total Tokens", justify="right", style="white")
             table.add_column("Cost", justify="right", style="red")
             
+            # Assemble all rows first, then feed them to the table in a
+            # tight loop with the bound method hoisted out
+            rows = []
             for day in daily_usage:
-                day_cost = day.calculate_total_cost(self.analyzer.pricing_data)
-                table.add_row(
-                    day.date.strftime('%Y-%m-%d'),
+                day_cost = day.calculate_total_cost(pricing_data)
+                rows.append(((
+                    # isoformat is C-implemented and skips strftime's
+                    # per-call format-string parsing
+                    day.date.isoformat(),
                     f"{len(day.sessions)}",
                     f"{day.total_interactions}",
                     f"{day.total_tokens.total:,}",
                     f"${day_cost:.2f}"
-                )
-                
+                ), None))
+
                 model_breakdown = self._get_model_breakdown_for_sessions(day.sessions)
-                for model_data in model_breakdown:
-                    table.add_row(
-                        f"  ↳ {model_data['model']}",
-                        f"{model_data['sessions']}",
-                        f"{model_data['interactions']}",
-                        f"{model_data['tokens']:,}",
-                        f"${model_data['cost']:.2f}",
-                        style="dim"
-                    )
+                rows.extend(((
+                    f"  ↳ {model_data['model']}",
+                    f"{model_data['sessions']}",
+                    f"{model_data['interactions']}",
+                    f"{model_data['tokens']:,}",
+                    f"${model_data['cost']:.2f}"
+                ), "dim") for model_data in model_breakdown)
+
+            add_row = table.add_row
+            for cells, style in rows:
+                add_row(*cells, style=style)
             
             self.console.print(table)
         else:
-            table = self.table_formatter.create_daily_table(daily_usage, self.analyzer.pricing_data)
+            table = self.table_formatter.create_daily_table(daily_usage, pricing_data)
             self.console.print(table)
 
     def _display_weekly_breakdown_table(self, weekly_usage: List[WeeklyUsage], breakdown: bool = False, week_start_day: int = 0):
@@ -582,8 +742,7 @@ class ReportGenerator:
             breakdown: Show per-model breakdown
             week_start_day: Day week starts on (0=Monday, 6=Sunday)
         """
-        from rich.table import Table
-        from ..utils.time_utils import TimeUtils, WEEKDAY_NAMES
+        pricing_data = self.analyzer.pricing_data
         
         title = "Weekly Usage Breakdown"
         if week_start_day != 0:
@@ -604,42 +763,44 @@ class ReportGenerator:
         table.add_column("Total Tokens", justify="right", style="white")
         table.add_column("Cost", justify="right", style="red")
 
+        rows = []
         for week in weekly_usage:
-            week_cost = week.calculate_total_cost(self.analyzer.pricing_data)
+            week_cost = week.calculate_total_cost(pricing_data)
             week_label = f"{week.year}-W{week.week:02d}"
             date_range = TimeUtils.format_week_range(week.start_date, week.end_date)
-            
-            table.add_row(
+
+            rows.append(((
                 week_label,
                 date_range,
                 f"{week.total_sessions}",
                 f"{week.total_interactions}",
                 f"{week.total_tokens.total:,}",
                 f"${week_cost:.2f}"
-            )
-            
+            ), None))
+
             if breakdown:
-                week_sessions = []
-                for day in week.daily_usage:
-                    week_sessions.extend(day.sessions)
-                
-                model_breakdown = self._get_model_breakdown_for_sessions(week_sessions)
-                for model_data in model_breakdown:
-                    table.add_row(
-                        "",
-                        f"  ↳ {model_data['model']}",
-                        f"{model_data['sessions']}",
-                        f"{model_data['interactions']}",
-                        f"{model_data['tokens']:,}",
-                        f"${model_data['cost']:.2f}",
-                        style="dim"
-                    )
+                # Feed the flattened sessions lazily; no intermediate list
+                model_breakdown = self._get_model_breakdown_for_sessions(
+                    chain.from_iterable(day.sessions for day in week.daily_usage)
+                )
+                rows.extend(((
+                    "",
+                    f"  ↳ {model_data['model']}",
+                    f"{model_data['sessions']}",
+                    f"{model_data['interactions']}",
+                    f"{model_data['tokens']:,}",
+                    f"${model_data['cost']:.2f}"
+                ), "dim") for model_data in model_breakdown)
+
+        add_row = table.add_row
+        for cells, style in rows:
+            add_row(*cells, style=style)
 
         self.console.print(table)
 
     def _display_monthly_breakdown_table(self, monthly_usage: List[MonthlyUsage], breakdown: bool = False):
         """Display monthly breakdown as table."""
-        from rich.table import Table
+        pricing_data = self.analyzer.pricing_data
         table = Table(
             title="Monthly Usage Breakdown",
             show_header=True,
@@ -653,32 +814,36 @@ class ReportGenerator:
         table.add_column("Total Tokens", justify="right", style="white")
         table.add_column("Cost", justify="right", style="red")
 
+        rows = []
         for month in monthly_usage:
-            month_cost = month.calculate_total_cost(self.analyzer.pricing_data)
-            table.add_row(
+            month_cost = month.calculate_total_cost(pricing_data)
+            rows.append(((
                 f"{month.year}-{month.month:02d}",
                 f"{month.total_sessions}",
                 f"{month.total_interactions}",
                 f"{month.total_tokens.total:,}",
                 f"${month_cost:.2f}"
-            )
-            
+            ), None))
+
             if breakdown:
-                month_sessions = []
-                for week in month.weekly_usage:
-                    for day in week.daily_usage:
-                        month_sessions.extend(day.sessions)
-                
-                model_breakdown = self._get_model_breakdown_for_sessions(month_sessions)
-                for model_data in model_breakdown:
-                    table.add_row(
-                        f"  ↳ {model_data['model']}",
-                        f"{model_data['sessions']}",
-                        f"{model_data['interactions']}",
-                        f"{model_data['tokens']:,}",
-                        f"${model_data['cost']:.2f}",
-                        style="dim"
+                model_breakdown = self._get_model_breakdown_for_sessions(
+                    chain.from_iterable(
+                        day.sessions
+                        for week in month.weekly_usage
+                        for day in week.daily_usage
                     )
+                )
+                rows.extend(((
+                    f"  ↳ {model_data['model']}",
+                    f"{model_data['sessions']}",
+                    f"{model_data['interactions']}",
+                    f"{model_data['tokens']:,}",
+                    f"${model_data['cost']:.2f}"
+                ), "dim") for model_data in model_breakdown)
+
+        add_row = table.add_row
+        for cells, style in rows:
+            add_row(*cells, style=style)
 
         self.console.print(table)
 
@@ -689,7 +854,6 @@ class ReportGenerator:
 
     def _display_projects_breakdown_table(self, project_breakdown: ProjectBreakdownReport):
         """Display projects breakdown as table."""
-        from rich.table import Table
         table = Table(title="Project Usage Breakdown", show_header=True)
 
         table.add_column("Project", style="cyan")
@@ -699,11 +863,15 @@ class ReportGenerator:
         table.add_column("Cost", justify="right", style="red")
         table.add_column("Models Used", style="dim cyan")
 
+        # Accumulate the summary totals in the same pass that builds the rows
+        # instead of re-walking the project list once per total
+        total_sessions = 0
+        total_interactions = 0
         for project in project_breakdown.project_stats:
-            # Truncate models list if too long
-            models_display = ", ".join(project.models_used)
-            if len(models_display) > 40:
-                models_display = models_display[:37] + "..."
+            total_sessions += project.total_sessions
+            total_interactions += project.total_interactions
+
+            models_display = self._format_models_display(project.models_used)
             
             table.add_row(
                 project.project_name,
@@ -717,11 +885,10 @@ class ReportGenerator:
         self.console.print(table)
 
         # Add summary
-        from rich.panel import Panel
         summary_text = (
             f"Total: {len(project_breakdown.project_stats)} projects, "
-            f"{sum(p.total_sessions for p in project_breakdown.project_stats)} sessions, "
-            f"{sum(p.total_interactions for p in project_breakdown.project_stats)} interactions, "
+            f"{total_sessions} sessions, "
+            f"{total_interactions} interactions, "
             f"{project_breakdown.total_tokens.total:,} tokens, "
             f"${project_breakdown.total_cost:.2f}"
         )
@@ -731,13 +898,14 @@ class ReportGenerator:
     # JSON formatting methods
     def _format_single_session_json(self, session: SessionData, stats: Dict[str, Any], health: Dict[str, Any]) -> Dict[str, Any]:
         """Format single session data as JSON."""
+        pricing_data = self.analyzer.pricing_data
         return {
             'session_id': session.session_id,
             'session_title': session.session_title,
             'project_name': session.project_name,
             'statistics': {
                 'interaction_count': stats['interaction_count'],
-                'total_tokens': stats['total_tokens'].model_dump(),
+                'total_tokens': stats['total_tokens'].as_dict(),
                 'total_cost': float(stats['total_cost']),
                 'models_used': stats['models_used']
             },
@@ -746,8 +914,8 @@ class ReportGenerator:
                 {
                     'file_name': file.file_name,
                     'model_id': file.model_id,
-                    'tokens': file.tokens.model_dump(),
-                    'cost': float(file.calculate_cost(self.analyzer.pricing_data))
+                    'tokens': file.tokens.as_dict(),
+                    'cost': float(file.calculate_cost(pricing_data))
                 }
                 for file in session.files
             ]
@@ -755,11 +923,12 @@ class ReportGenerator:
 
     def _format_sessions_summary_json(self, sessions: List[SessionData], summary: Dict[str, Any]) -> Dict[str, Any]:
         """Format sessions summary as JSON."""
+        pricing_data = self.analyzer.pricing_data
         return {
             'summary': {
                 'total_sessions': summary['total_sessions'],
                 'total_interactions': summary['total_interactions'],
-                'total_tokens': summary['total_tokens'].model_dump(),
+                'total_tokens': summary['total_tokens'].as_dict(),
                 'total_cost': float(summary['total_cost']),
                 'models_used': summary['models_used'],
                 'date_range': summary['date_range']
@@ -770,11 +939,11 @@ class ReportGenerator:
                     'session_title': session.session_title,
                     'project_name': session.project_name,
                     'interaction_count': session.interaction_count,
-                    'total_tokens': session.total_tokens.model_dump(),
-                    'total_cost': float(session.calculate_total_cost(self.analyzer.pricing_data)),
+                    'total_tokens': session.total_tokens.as_dict(),
+                    'total_cost': float(session.calculate_total_cost(pricing_data)),
                     'models_used': session.models_used,
-                    'start_time': session.start_time.isoformat() if session.start_time else None,
-                    'end_time': session.end_time.isoformat() if session.end_time else None
+                    'start_time': _iso(session.start_time),
+                    'end_time': _iso(session.end_time)
                 }
                 for session in sessions
             ]
@@ -782,14 +951,15 @@ class ReportGenerator:
 
     def _format_daily_breakdown_json(self, daily_usage: List[DailyUsage]) -> Dict[str, Any]:
         """Format daily breakdown as JSON."""
+        pricing_data = self.analyzer.pricing_data
         return {
             'daily_breakdown': [
                 {
-                    'date': day.date.isoformat(),
+                    'date': _iso(day.date),
                     'sessions': len(day.sessions),
                     'interactions': day.total_interactions,
-                    'tokens': day.total_tokens.model_dump(),
-                    'cost': float(day.calculate_total_cost(self.analyzer.pricing_data)),
+                    'tokens': day.total_tokens.as_dict(),
+                    'cost': float(day.calculate_total_cost(pricing_data)),
                     'models_used': day.models_used
                 }
                 for day in daily_usage
@@ -798,17 +968,18 @@ class ReportGenerator:
 
     def _format_weekly_breakdown_json(self, weekly_usage: List[WeeklyUsage]) -> Dict[str, Any]:
         """Format weekly breakdown as JSON."""
+        pricing_data = self.analyzer.pricing_data
         return {
             'weekly_breakdown': [
                 {
                     'year': week.year,
                     'week': week.week,
-                    'start_date': week.start_date.isoformat(),
-                    'end_date': week.end_date.isoformat(),
+                    'start_date': _iso(week.start_date),
+                    'end_date': _iso(week.end_date),
                     'sessions': week.total_sessions,
                     'interactions': week.total_interactions,
-                    'tokens': week.total_tokens.model_dump(),
-                    'cost': float(week.calculate_total_cost(self.analyzer.pricing_data))
+                    'tokens': week.total_tokens.as_dict(),
+                    'cost': float(week.calculate_total_cost(pricing_data))
                 }
                 for week in weekly_usage
             ]
@@ -816,6 +987,7 @@ class ReportGenerator:
 
     def _format_monthly_breakdown_json(self, monthly_usage: List[MonthlyUsage]) -> Dict[str, Any]:
         """Format monthly breakdown as JSON."""
+        pricing_data = self.analyzer.pricing_data
         return {
             'monthly_breakdown': [
                 {
@@ -823,8 +995,8 @@ class ReportGenerator:
                     'month': month.month,
                     'sessions': month.total_sessions,
                     'interactions': month.total_interactions,
-                    'tokens': month.total_tokens.model_dump(),
-                    'cost': float(month.calculate_total_cost(self.analyzer.pricing_data))
+                    'tokens': month.total_tokens.as_dict(),
+                    'cost': float(month.calculate_total_cost(pricing_data))
                 }
                 for month in monthly_usage
             ]
@@ -834,184 +1006,244 @@ class ReportGenerator:
         """Format models breakdown as JSON."""
         return {
             'timeframe': model_breakdown.timeframe,
-            'start_date': model_breakdown.start_date.isoformat() if model_breakdown.start_date else None,
-            'end_date': model_breakdown.end_date.isoformat() if model_breakdown.end_date else None,
-            'total_cost': float(model_breakdown.total_cost),
-            'total_tokens': model_breakdown.total_tokens.model_dump(),
+            'start_date': _iso(model_breakdown.start_date),
+            'end_date': _iso(model_breakdown.end_date),
+            'total_cost': model_breakdown.total_cost_float,
+            'total_tokens': model_breakdown.total_tokens.as_dict(),
             'models': [
                 {
                     'model_name': model.model_name,
                     'sessions': model.total_sessions,
                     'interactions': model.total_interactions,
-                    'tokens': model.total_tokens.model_dump(),
-                    'cost': float(model.total_cost),
+                    'tokens': model.total_tokens.as_dict(),
+                    'cost': model.total_cost_float,
                     'avg_output_rate': model.avg_output_rate,
-                    'first_used': model.first_used.isoformat() if model.first_used else None,
-                    'last_used': model.last_used.isoformat() if model.last_used else None
+                    'first_used': _iso(model.first_used),
+                    'last_used': _iso(model.last_used)
                 }
                 for model in model_breakdown.model_stats
             ]
         }
 
-    # CSV formatting methods (returning data structures for export service)
-    def _format_single_session_csv(self, session: SessionData, stats: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # CSV formatting methods. Each returns (fieldnames, row generator):
+    # rows are plain tuples in fieldname order, so large exports never
+    # materialize one dict per row and the writer can stream them.
+    def _format_single_session_csv(self, session: SessionData,
+                                   stats: Dict[str, Any]) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """Format single session data for CSV export."""
-        return [
-            {
-                'session_id': session.session_id,
-                'session_title': session.session_title,
-                'project_name': session.project_name,
-                'file_name': file.file_name,
-                'model_id': file.model_id,
-                'input_tokens': file.tokens.input,
-                'output_tokens': file.tokens.output,
-                'cache_write_tokens': file.tokens.cache_write,
-                'cache_read_tokens': file.tokens.cache_read,
-                'total_tokens': file.tokens.total,
-                'cost': float(file.calculate_cost(self.analyzer.pricing_data)),
-                'duration_ms': file.time_data.duration_ms if file.time_data else None
-            }
+        pricing_data = self.analyzer.pricing_data
+        fieldnames = (
+            'session_id', 'session_title', 'project_name', 'file_name',
+            'model_id', 'input_tokens', 'output_tokens', 'cache_write_tokens',
+            'cache_read_tokens', 'total_tokens', 'cost', 'duration_ms'
+        )
+        rows = (
+            (
+                session.session_id,
+                session.session_title,
+                session.project_name,
+                file.file_name,
+                file.model_id,
+                file.tokens.input,
+                file.tokens.output,
+                file.tokens.cache_write,
+                file.tokens.cache_read,
+                file.tokens.total,
+                float(file.calculate_cost(pricing_data)),
+                file.time_data.duration_ms if file.time_data else None
+            )
             for file in session.files
-        ]
+        )
+        return fieldnames, rows
 
-    def _format_sessions_summary_csv(self, sessions: List[SessionData]) -> List[Dict[str, Any]]:
+    def _format_sessions_summary_csv(self, sessions: List[SessionData]) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """Format sessions summary for CSV export."""
-        rows = []
-        for session in sessions:
-            model_breakdown = session.get_model_breakdown(self.analyzer.pricing_data)
-            for model, stats in model_breakdown.items():
-                rows.append({
-                    'session_id': session.session_id,
-                    'session_title': session.session_title,
-                    'project_name': session.project_name,
-                    'start_time': session.start_time.isoformat() if session.start_time else None,
-                    'duration_ms': session.duration_ms,
-                    'model': model,
-                    'interactions': stats['files'],
-                    'input_tokens': stats['tokens'].input,
-                    'output_tokens': stats['tokens'].output,
-                    'cache_write_tokens': stats['tokens'].cache_write,
-                    'cache_read_tokens': stats['tokens'].cache_read,
-                    'total_tokens': stats['tokens'].total,
-                    'cost': float(stats['cost'])
-                })
-        return rows
-
-    def _format_daily_breakdown_csv(self, daily_usage: List[DailyUsage]) -> List[Dict[str, Any]]:
+        pricing_data = self.analyzer.pricing_data
+        fieldnames = (
+            'session_id', 'session_title', 'project_name', 'start_time',
+            'duration_ms', 'model', 'interactions', 'input_tokens',
+            'output_tokens', 'cache_write_tokens', 'cache_read_tokens',
+            'total_tokens', 'cost'
+        )
+        rows = (
+            (
+                session.session_id,
+                session.session_title,
+                session.project_name,
+                _iso(session.start_time),
+                session.duration_ms,
+                model,
+                stats['files'],
+                tokens.input,
+                tokens.output,
+                tokens.cache_write,
+                tokens.cache_read,
+                tokens.total,
+                float(stats['cost'])
+            )
+            for session in sessions
+            for model, stats in session.get_model_breakdown(pricing_data).items()
+            for tokens in (stats['tokens'],)
+        )
+        return fieldnames, rows
+
+    def _format_daily_breakdown_csv(self, daily_usage: List[DailyUsage]) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """Format daily breakdown for CSV export."""
-        return [
-            {
-                'date': day.date.isoformat(),
-                'sessions': len(day.sessions),
-                'interactions': day.total_interactions,
-                'input_tokens': day.total_tokens.input,
-                'output_tokens': day.total_tokens.output,
-                'cache_write_tokens': day.total_tokens.cache_write,
-                'cache_read_tokens': day.total_tokens.cache_read,
-                'total_tokens': day.total_tokens.total,
-                'cost': float(day.calculate_total_cost(self.analyzer.pricing_data)),
-                'models_used': ', '.join(day.models_used)
-            }
+        pricing_data = self.analyzer.pricing_data
+        fieldnames = (
+            'date', 'sessions', 'interactions', 'input_tokens',
+            'output_tokens', 'cache_write_tokens', 'cache_read_tokens',
+            'total_tokens', 'cost', 'models_used'
+        )
+        # Bind each period's TokenUsage once instead of resolving the
+        # day.total_tokens chain for all five columns
+        rows = (
+            (
+                _iso(day.date),
+                len(day.sessions),
+                day.total_interactions,
+                tokens.input,
+                tokens.output,
+                tokens.cache_write,
+                tokens.cache_read,
+                tokens.total,
+                float(day.calculate_total_cost(pricing_data)),
+                ', '.join(day.models_used)
+            )
             for day in daily_usage
-        ]
+            for tokens in (day.total_tokens,)
+        )
+        return fieldnames, rows
 
-    def _format_weekly_breakdown_csv(self, weekly_usage: List[WeeklyUsage]) -> List[Dict[str, Any]]:
+    def _format_weekly_breakdown_csv(self, weekly_usage: List[WeeklyUsage]) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """Format weekly breakdown for CSV export."""
-        return [
-            {
-                'year': week.year,
-                'week': week.week,
-                'start_date': week.start_date.isoformat(),
-                'end_date': week.end_date.isoformat(),
-                'sessions': week.total_sessions,
-                'interactions': week.total_interactions,
-                'input_tokens': week.total_tokens.input,
-                'output_tokens': week.total_tokens.output,
-                'cache_write_tokens': week.total_tokens.cache_write,
-                'cache_read_tokens': week.total_tokens.cache_read,
-                'total_tokens': week.total_tokens.total,
-                'cost': float(week.calculate_total_cost(self.analyzer.pricing_data))
-            }
+        pricing_data = self.analyzer.pricing_data
+        fieldnames = (
+            'year', 'week', 'start_date', 'end_date', 'sessions',
+            'interactions', 'input_tokens', 'output_tokens',
+            'cache_write_tokens', 'cache_read_tokens', 'total_tokens', 'cost'
+        )
+        rows = (
+            (
+                week.year,
+                week.week,
+                _iso(week.start_date),
+                _iso(week.end_date),
+                week.total_sessions,
+                week.total_interactions,
+                tokens.input,
+                tokens.output,
+                tokens.cache_write,
+                tokens.cache_read,
+                tokens.total,
+                float(week.calculate_total_cost(pricing_data))
+            )
             for week in weekly_usage
-        ]
+            for tokens in (week.total_tokens,)
+        )
+        return fieldnames, rows
 
-    def _format_monthly_breakdown_csv(self, monthly_usage: List[MonthlyUsage]) -> List[Dict[str, Any]]:
+    def _format_monthly_breakdown_csv(self, monthly_usage: List[MonthlyUsage]) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """Format monthly breakdown for CSV export."""
-        return [
-            {
-                'year': month.year,
-                'month': month.month,
-                'sessions': month.total_sessions,
-                'interactions': month.total_interactions,
-                'input_tokens': month.total_tokens.input,
-                'output_tokens': month.total_tokens.output,
-                'cache_write_tokens': month.total_tokens.cache_write,
-                'cache_read_tokens': month.total_tokens.cache_read,
-                'total_tokens': month.total_tokens.total,
-                'cost': float(month.calculate_total_cost(self.analyzer.pricing_data))
-            }
+        pricing_data = self.analyzer.pricing_data
+        fieldnames = (
+            'year', 'month', 'sessions', 'interactions', 'input_tokens',
+            'output_tokens', 'cache_write_tokens', 'cache_read_tokens',
+            'total_tokens', 'cost'
+        )
+        rows = (
+            (
+                month.year,
+                month.month,
+                month.total_sessions,
+                month.total_interactions,
+                tokens.input,
+                tokens.output,
+                tokens.cache_write,
+                tokens.cache_read,
+                tokens.total,
+                float(month.calculate_total_cost(pricing_data))
+            )
             for month in monthly_usage
-        ]
+            for tokens in (month.total_tokens,)
+        )
+        return fieldnames, rows
 
-    def _format_models_breakdown_csv(self, model_breakdown: ModelBreakdownReport) -> List[Dict[str, Any]]:
+    def _format_models_breakdown_csv(self, model_breakdown: ModelBreakdownReport) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """Format models breakdown for CSV export."""
-        return [
-            {
-                'model_name': model.model_name,
-                'sessions': model.total_sessions,
-                'interactions': model.total_interactions,
-                'input_tokens': model.total_tokens.input,
-                'output_tokens': model.total_tokens.output,
-                'cache_write_tokens': model.total_tokens.cache_write,
-                'cache_read_tokens': model.total_tokens.cache_read,
-                'total_tokens': model.total_tokens.total,
-                'cost': float(model.total_cost),
-                'avg_output_rate': model.avg_output_rate,
-                'first_used': model.first_used.isoformat() if model.first_used else None,
-                'last_used': model.last_used.isoformat() if model.last_used else None
-            }
+        fieldnames = (
+            'model_name', 'sessions', 'interactions', 'input_tokens',
+            'output_tokens', 'cache_write_tokens', 'cache_read_tokens',
+            'total_tokens', 'cost', 'avg_output_rate', 'first_used',
+            'last_used'
+        )
+        rows = (
+            (
+                model.model_name,
+                model.total_sessions,
+                model.total_interactions,
+                tokens.input,
+                tokens.output,
+                tokens.cache_write,
+                tokens.cache_read,
+                tokens.total,
+                model.total_cost_float,
+                model.avg_output_rate,
+                _iso(model.first_used),
+                _iso(model.last_used)
+            )
             for model in model_breakdown.model_stats
-        ]
+            for tokens in (model.total_tokens,)
+        )
+        return fieldnames, rows
 
     def _format_projects_breakdown_json(self, project_breakdown: ProjectBreakdownReport) -> Dict[str, Any]:
         """Format projects breakdown as JSON."""
         return {
             'timeframe': project_breakdown.timeframe,
-            'start_date': project_breakdown.start_date.isoformat() if project_breakdown.start_date else None,
-            'end_date': project_breakdown.end_date.isoformat() if project_breakdown.end_date else None,
-            'total_cost': float(project_breakdown.total_cost),
-            'total_tokens': project_breakdown.total_tokens.model_dump(),
+            'start_date': _iso(project_breakdown.start_date),
+            'end_date': _iso(project_breakdown.end_date),
+            'total_cost': project_breakdown.total_cost_float,
+            'total_tokens': project_breakdown.total_tokens.as_dict(),
             'projects': [
                 {
                     'project_name': project.project_name,
                     'sessions': project.total_sessions,
                     'interactions': project.total_interactions,
-                    'tokens': project.total_tokens.model_dump(),
-                    'cost': float(project.total_cost),
+                    'tokens': project.total_tokens.as_dict(),
+                    'cost': project.total_cost_float,
                     'models_used': project.models_used,
-                    'first_activity': project.first_activity.isoformat() if project.first_activity else None,
-                    'last_activity': project.last_activity.isoformat() if project.last_activity else None
+                    'first_activity': _iso(project.first_activity),
+                    'last_activity': _iso(project.last_activity)
                 }
                 for project in project_breakdown.project_stats
             ]
         }
 
-    def _format_projects_breakdown_csv(self, project_breakdown: ProjectBreakdownReport) -> List[Dict[str, Any]]:
+    def _format_projects_breakdown_csv(self, project_breakdown: ProjectBreakdownReport) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """Format projects breakdown for CSV export."""
-        return [
-            {
-                'project_name': project.project_name,
-                'sessions': project.total_sessions,
-                'interactions': project.total_interactions,
-                'input_tokens': project.total_tokens.input,
-                'output_tokens': project.total_tokens.output,
-                'cache_write_tokens': project.total_tokens.cache_write,
-                'cache_read_tokens': project.total_tokens.cache_read,
-                'total_tokens': project.total_tokens.total,
-                'cost': float(project.total_cost),
-                'models_used': ', '.join(project.models_used),
-                'first_activity': project.first_activity.isoformat() if project.first_activity else None,
-                'last_activity': project.last_activity.isoformat() if project.last_activity else None
-            }
+        fieldnames = (
+            'project_name', 'sessions', 'interactions', 'input_tokens',
+            'output_tokens', 'cache_write_tokens', 'cache_read_tokens',
+            'total_tokens', 'cost', 'models_used', 'first_activity',
+            'last_activity'
+        )
+        rows = (
+            (
+                project.project_name,
+                project.total_sessions,
+                project.total_interactions,
+                tokens.input,
+                tokens.output,
+                tokens.cache_write,
+                tokens.cache_read,
+                tokens.total,
+                project.total_cost_float,
+                ', '.join(project.models_used),
+                _iso(project.first_activity),
+                _iso(project.last_activity)
+            )
             for project in project_breakdown.project_stats
-        ]
\ No newline at end of file
+            for tokens in (project.total_tokens,)
+        )
+        return fieldnames, rows
@@ -9,10 +9,10 @@ from decimal import Decimal
 from ..models.session import SessionData, InteractionFile, TokenUsage
 from ..models.analytics import (
     DailyUsage, WeeklyUsage, MonthlyUsage, ModelUsageStats,
-    ModelBreakdownReport, ProjectBreakdownReport, TimeframeAnalyzer
+    ModelBreakdownReport, ProjectBreakdownReport, TimeframeAnalyzer,
+    _filter_sessions_by_date
 )
 from ..utils.file_utils import FileProcessor
-from ..utils.time_utils import TimeUtils
 from ..config import ModelPricing
 
 
@@ -49,6 +49,8 @@ class SessionAnalyzer:
         Returns:
             List of SessionData objects
         """
+        # FileProcessor owns the discovery and thread-pool loading; keep
+        # the pool sizing and error handling in one place
         return FileProcessor.load_all_sessions(base_path, limit)
 
     def get_sessions_summary(self, sessions: List[SessionData]) -> Dict[str, Any]:
@@ -78,12 +80,7 @@ class SessionAnalyzer:
         end_times = []
 
         for session in sessions:
-            session_tokens = session.total_tokens
-            total_tokens.input += session_tokens.input
-            total_tokens.output += session_tokens.output
-            total_tokens.cache_write += session_tokens.cache_write
-            total_tokens.cache_read += session_tokens.cache_read
-
+            total_tokens += session.total_tokens
             total_cost += session.calculate_total_cost(self.pricing_data)
             total_interactions += session.interaction_count
             models_used.update(session.models_used)
@@ -151,6 +148,19 @@ class SessionAnalyzer:
         weekly_usage = TimeframeAnalyzer.create_weekly_breakdown(daily_usage)
         return TimeframeAnalyzer.create_monthly_breakdown(weekly_usage)
 
+    def create_all_breakdowns(self, sessions: List[SessionData],
+                              week_start_day: int = 0) -> tuple:
+        """Create daily, weekly and monthly breakdowns in a single pass.
+
+        Args:
+            sessions: List of sessions to analyze
+            week_start_day: Day to start week on (0=Monday, 6=Sunday)
+
+        Returns:
+            Tuple of (daily, weekly, monthly) breakdown lists
+        """
+        return TimeframeAnalyzer.create_all_breakdowns(sessions, week_start_day)
+
     def create_model_breakdown(self, sessions: List[SessionData],
                              timeframe: str = "all",
                              start_date: Optional[date] = None,
@@ -202,17 +212,9 @@ class SessionAnalyzer:
         Returns:
             Filtered list of sessions
         """
-        if not start_date and not end_date:
-            return sessions
-
-        filtered = []
-        for session in sessions:
-            if session.start_time:
-                session_date = session.start_time.date()
-                if TimeUtils.date_in_range(session_date, start_date, end_date):
-                    filtered.append(session)
-
-        return filtered
+        # Delegates to the shared helper, which bisects sorted-by-date lists
+        # instead of comparing every session
+        return _filter_sessions_by_date(sessions, start_date, end_date)
 
     def filter_sessions_by_model(self, sessions: List[SessionData], models: List[str]) -> List[SessionData]:
         """Filter sessions by models used.
@@ -1,7 +1,8 @@
 """Live dashboard UI components for OpenCode Monitor."""
 
-import os
 import time
+from bisect import bisect_right
+from functools import lru_cache
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, Optional
@@ -20,6 +21,18 @@ from ..models.workflow import SessionWorkflow
 from ..utils.time_utils import TimeUtils
 
 
+@lru_cache(maxsize=256)
+def _fmt_int(n: int) -> str:
+    """Thousands-format an integer, caching values that repeat across frames."""
+    return f"{n:,}"
+
+
+@lru_cache(maxsize=1024)
+def _trunc_model(model: str) -> str:
+    """Truncate a model name for panel display, once per distinct name."""
+    return model[:25] + "..." if len(model) > 28 else model
+
+
 class DashboardUI:
     """UI components for the live dashboard."""
 
@@ -30,48 +43,144 @@ class DashboardUI:
             console: Rich console instance. If None, creates a new one.
         """
         self.console = console or Console()
+        # Rendered panels keyed by panel name; each entry is (key, Panel)
+        # where key captures every input the panel text depends on. Most
+        # panels change far less often than the refresh tick, so repeat
+        # frames skip the f-string build and Rich markup parse entirely.
+        self._panel_cache: Dict[str, tuple] = {}
+        # Header timestamp cache: (epoch second, formatted string)
+        self._ts_cache = (0, "")
+        # Last model breakdown: (key, (session, pricing_data), breakdown)
+        self._model_breakdown_cache: Optional[tuple] = None
+        # Last session cost: (key, pricing_data, Decimal cost)
+        self._session_cost_cache: Optional[tuple] = None
+        # Fully-built bar bodies per (fill char, width), populated lazily
+        self._bar_bodies: Dict[tuple, list] = {}
+        # Static empty-state panels, built once; Panels are immutable for
+        # rendering, so returning the same instance every frame is safe
+        self._empty_models = Panel(
+            "[dim]No model data available[/dim]",
+            title="Models", border_style="dim white",
+        )
+        self._empty_context = Panel(
+            "[dim]No recent interaction[/dim]",
+            title="Context", border_style="dim white",
+        )
+        self._empty_session_time = Panel(
+            "[dim]No session timing data[/dim]",
+            title="Session Time", border_style="dim white",
+        )
+        self._empty_recent = Panel(
+            "[dim]No recent files[/dim]", title="Recent", border_style="dim white"
+        )
+
+    def _current_time_str(self) -> str:
+        """Format the current time, reusing the string within one second.
+
+        Sub-second refresh rates would otherwise re-run strftime per tick
+        for output that only changes once a second.
+        """
+        sec = int(time.time())
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (
+                sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            )
+        return self._ts_cache[1]
+
+    # Constant leading spans of the header line, shared by both variants
+    _HEADER_PREFIX = (
+        ("OpenCode Live Dashboard", "bold blue"), ("  Project: ", "dim"),
+    )
 
     def create_header(
         self, session: SessionData, workflow: Optional[SessionWorkflow] = None
     ) -> Panel:
         """Create header panel with session info."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time = self._current_time_str()
+
+        if workflow and workflow.has_sub_agents:
+            key = (current_time, workflow.project_name, workflow.display_title,
+                   workflow.session_count, workflow.sub_agent_count)
+        else:
+            key = (current_time, session.project_name, session.display_title,
+                   session.interaction_count)
+        cached = self._panel_cache.get('header')
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         if workflow and workflow.has_sub_agents:
             # Show workflow info with sub-agent count
-            header_text = f"""[bold blue]OpenCode Live Dashboard[/bold blue]  [dim]Project:[/dim] [bold cyan]{workflow.project_name}[/bold cyan]  [dim]Session:[/dim] [bold white]{workflow.display_title}[/bold white]  [dim]Updated:[/dim] [bold white]{current_time}[/bold white]  [dim]Workflow:[/dim] [bold yellow]{workflow.session_count} sessions[/bold yellow] [dim]([/dim][bold white]1 main + {workflow.sub_agent_count} sub[/bold white][dim])[/dim]"""
+            header_text = Text.assemble(
+                *self._HEADER_PREFIX,
+                (workflow.project_name, "bold cyan"), ("  Session:", "dim"),
+                (f" {workflow.display_title}", "bold white"), ("  Updated:", "dim"),
+                (f" {current_time}", "bold white"), ("  Workflow:", "dim"),
+                (f" {workflow.session_count} sessions", "bold yellow"),
+                (" (", "dim"),
+                (f"1 main + {workflow.sub_agent_count} sub", "bold white"),
+                (")", "dim"),
+            )
         else:
-            header_text = f"""[bold blue]OpenCode Live Dashboard[/bold blue]  [dim]Project:[/dim] [bold cyan]{session.project_name}[/bold cyan]  [dim]Session:[/dim] [bold white]{session.display_title}[/bold white]  [dim]Updated:[/dim] [bold white]{current_time}[/bold white]  [dim]Interactions:[/dim] [bold white]{session.interaction_count}[/bold white]"""
+            header_text = Text.assemble(
+                *self._HEADER_PREFIX,
+                (session.project_name, "bold cyan"), ("  Session:", "dim"),
+                (f" {session.display_title}", "bold white"), ("  Updated:", "dim"),
+                (f" {current_time}", "bold white"), ("  Interactions:", "dim"),
+                (f" {session.interaction_count}", "bold white"),
+            )
 
-        return Panel(
+        panel = Panel(
             header_text, title="Dashboard", title_align="left", border_style="dim blue"
         )
+        self._panel_cache['header'] = (key, panel)
+        return panel
 
     def create_token_panel(
         self, session: SessionData, recent_file: Optional[Any] = None
     ) -> Panel:
         """Create token consumption panel."""
         session_tokens = session.total_tokens
-
-        # Create compact horizontal layout
-        if recent_file:
-            token_text = f"""[bold blue]Recent Interaction[/bold blue]
-[dim]Input:[/dim] [bold white]{recent_file.tokens.input:,}[/bold white]    [dim]Cache W:[/dim] [bold white]{recent_file.tokens.cache_write:,}[/bold white]
-[dim]Output:[/dim] [bold white]{recent_file.tokens.output:,}[/bold white]   [dim]Cache R:[/dim] [bold white]{recent_file.tokens.cache_read:,}[/bold white]
-
-[bold blue]Session Totals[/bold blue]
-[dim]Input:[/dim] [bold white]{session_tokens.input:,}[/bold white]    [dim]Cache W:[/dim] [bold white]{session_tokens.cache_write:,}[/bold white]
-[dim]Output:[/dim] [bold white]{session_tokens.output:,}[/bold white]   [dim]Cache R:[/dim] [bold white]{session_tokens.cache_read:,}[/bold white]
-[dim]Total:[/dim] [bold cyan]{session_tokens.total:,}[/bold cyan]"""
-        else:
-            token_text = f"""[bold blue]Session Totals[/bold blue]
-[dim]Input:[/dim] [bold white]{session_tokens.input:,}[/bold white]    [dim]Cache W:[/dim] [bold white]{session_tokens.cache_write:,}[/bold white]
-[dim]Output:[/dim] [bold white]{session_tokens.output:,}[/bold white]   [dim]Cache R:[/dim] [bold white]{session_tokens.cache_read:,}[/bold white]
-[dim]Total:[/dim] [bold cyan]{session_tokens.total:,}[/bold cyan]"""
-
-        return Panel(
+        recent_tokens = recent_file.tokens if recent_file else None
+
+        key = (
+            session_tokens.input, session_tokens.output,
+            session_tokens.cache_write, session_tokens.cache_read,
+            recent_tokens.input if recent_tokens else None,
+            recent_tokens.output if recent_tokens else None,
+            recent_tokens.cache_write if recent_tokens else None,
+            recent_tokens.cache_read if recent_tokens else None,
+        )
+        cached = self._panel_cache.get('tokens')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Assemble styled spans directly so Rich never has to run its
+        # markup lexer over the panel body on rebuild
+        segments = []
+        if recent_tokens:
+            segments += [
+                ("Recent Interaction", "bold blue"), "\n",
+                ("Input: ", "dim"), (_fmt_int(recent_tokens.input), "bold white"),
+                ("    "), ("Cache W: ", "dim"), (_fmt_int(recent_tokens.cache_write), "bold white"), "\n",
+                ("Output: ", "dim"), (_fmt_int(recent_tokens.output), "bold white"),
+                ("   "), ("Cache R: ", "dim"), (_fmt_int(recent_tokens.cache_read), "bold white"),
+                "\n\n",
+            ]
+        segments += [
+            ("Session Totals", "bold blue"), "\n",
+            ("Input: ", "dim"), (_fmt_int(session_tokens.input), "bold white"),
+            ("    "), ("Cache W: ", "dim"), (_fmt_int(session_tokens.cache_write), "bold white"), "\n",
+            ("Output: ", "dim"), (_fmt_int(session_tokens.output), "bold white"),
+            ("   "), ("Cache R: ", "dim"), (_fmt_int(session_tokens.cache_read), "bold white"), "\n",
+            ("Total: ", "dim"), (_fmt_int(session_tokens.total), "bold cyan"),
+        ]
+        token_text = Text.assemble(*segments)
+
+        panel = Panel(
             token_text, title="Tokens", title_align="left", border_style="dim white"
         )
+        self._panel_cache['tokens'] = (key, panel)
+        return panel
 
     def create_cost_panel(
         self,
@@ -80,86 +189,148 @@ class DashboardUI:
         quota: Optional[Decimal] = None,
     ) -> Panel:
         """Create cost tracking panel."""
-        total_cost = session.calculate_total_cost(pricing_data)
+        # The monitor loop rebuilds SessionData objects each scan, so the
+        # model's own per-pricing cost memo starts cold every tick; keep the
+        # last cost here keyed on what the cost walk depends on
+        cost_key = (session.session_id, session.interaction_count,
+                    session.total_tokens.total, id(pricing_data))
+        cached_cost = self._session_cost_cache
+        if cached_cost is not None and cached_cost[0] == cost_key:
+            total_cost = cached_cost[2]
+        else:
+            total_cost = session.calculate_total_cost(pricing_data)
+            self._session_cost_cache = (cost_key, pricing_data, total_cost)
+
+        key = (total_cost, quota)
+        cached = self._panel_cache.get('cost')
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         if quota:
             percentage = min(100, float(total_cost / quota) * 100)
             progress_bar = self.create_compact_progress_bar(percentage)
             cost_color = self.get_cost_color(percentage)
 
-            cost_text = f"""[bold blue]Cost Tracking[/bold blue]
-[dim]Session:[/dim] [bold white]${total_cost:.2f}[/bold white]
-[dim]Quota:[/dim] [bold white]${quota:.2f}[/bold white]
-[{cost_color}]{progress_bar}[/{cost_color}]"""
+            cost_text = Text.assemble(
+                ("Cost Tracking", "bold blue"), "\n",
+                ("Session:", "dim"), (f" ${total_cost:.2f}", "bold white"), "\n",
+                ("Quota:", "dim"), (f" ${quota:.2f}", "bold white"), "\n",
+                (progress_bar, cost_color),
+            )
         else:
-            cost_text = f"""[bold blue]Cost Tracking[/bold blue]
-[dim]Session:[/dim] [bold white]${total_cost:.2f}[/bold white]
-[dim]No quota configured[/dim]"""
+            cost_text = Text.assemble(
+                ("Cost Tracking", "bold blue"), "\n",
+                ("Session:", "dim"), (f" ${total_cost:.2f}", "bold white"), "\n",
+                ("No quota configured", "dim"),
+            )
 
-        return Panel(
+        panel = Panel(
             cost_text, title="Cost", title_align="left", border_style="dim white"
         )
+        self._panel_cache['cost'] = (key, panel)
+        return panel
+
+    def _session_model_breakdown(
+        self, session: SessionData, pricing_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Get the session's model breakdown, reusing it across ticks.
+
+        The aggregation walks every interaction; between interactions the
+        result cannot change, so key on the session identity, its
+        interaction count and the pricing mapping.
+        """
+        key = (id(session), session.interaction_count,
+               session.total_tokens.total, id(pricing_data))
+        cached = self._model_breakdown_cache
+        if cached is not None and cached[0] == key:
+            return cached[2]
+        breakdown = session.get_model_breakdown(pricing_data)
+        # Keep the session and pricing references alive so the ids in the
+        # key cannot be recycled by other objects
+        self._model_breakdown_cache = (key, (session, pricing_data), breakdown)
+        return breakdown
 
     def create_model_panel(
         self, session: SessionData, pricing_data: Dict[str, Any]
     ) -> Panel:
         """Create model usage panel."""
-        model_breakdown = session.get_model_breakdown(pricing_data)
+        model_breakdown = self._session_model_breakdown(session, pricing_data)
 
         if not model_breakdown:
-            return Panel(
-                "[dim]No model data available[/dim]",
-                title="Models",
-                border_style="dim white",
-            )
-
-        model_lines = []
-        for model, stats in model_breakdown.items():
-            model_name = model[:25] + "..." if len(model) > 28 else model
-            model_lines.append(
-                f"[dim]{model_name}[/dim]  "
-                f"[bold white]{stats['tokens'].total:,}[/bold white] [dim cyan]tokens[/dim cyan]  "
-                f"[bold white]${stats['cost']:.2f}[/bold white]"
-            )
-
-        model_text = "\n".join(model_lines)
+            return self._empty_models
+
+        # Most expensive models first, so the ordering is stable across
+        # refreshes instead of following dict insertion order
+        ordered = sorted(
+            model_breakdown.items(),
+            key=lambda kv: kv[1]['cost_scaled'],
+            reverse=True,
+        )
 
-        return Panel(
+        key = tuple(
+            (model, stats['tokens'].total, stats['cost_scaled'])
+            for model, stats in ordered
+        )
+        cached = self._panel_cache.get('models')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        model_text = Text()
+        for model, stats in ordered:
+            model_name = _trunc_model(model)
+            if model_text:
+                model_text.append("\n")
+            model_text.append(model_name, "dim")
+            model_text.append(f"  {stats['tokens'].total:,}", "bold white")
+            model_text.append(" tokens", "dim cyan")
+            model_text.append(f"  ${stats['cost']:.2f}", "bold white")
+
+        panel = Panel(
             model_text, title="Models", title_align="left", border_style="dim white"
         )
+        self._panel_cache['models'] = (key, panel)
+        return panel
 
     def create_context_panel(
         self, recent_file: Optional[Any], context_window: int = 200000
     ) -> Panel:
         """Create context window status panel."""
         if not recent_file:
-            return Panel(
-                "[dim]No recent interaction[/dim]",
-                title="Context",
-                border_style="dim white",
-            )
+            return self._empty_context
 
         # Calculate context size (input + cache read + cache write from most recent)
-        context_size = (
-            recent_file.tokens.input
-            + recent_file.tokens.cache_read
-            + recent_file.tokens.cache_write
-        )
+        tokens = recent_file.tokens
+        context_size = tokens.input + tokens.cache_read + tokens.cache_write
+
+        key = (context_size, context_window)
+        cached = self._panel_cache.get('context')
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         percentage = min(100, (context_size / context_window) * 100)
         progress_bar = self.create_compact_progress_bar(percentage, 12)
         context_color = self.get_context_color(percentage)
 
-        context_text = f"""[dim]Size:[/dim] [bold white]{context_size:,}[/bold white]
-[dim]Window:[/dim] [bold white]{context_window:,}[/bold white]
-[{context_color}]{progress_bar}[/{context_color}]"""
+        context_text = Text.assemble(
+            ("Size:", "dim"), (f" {context_size:,}", "bold white"), "\n",
+            ("Window:", "dim"), (f" {context_window:,}", "bold white"), "\n",
+            (progress_bar, context_color),
+        )
 
-        return Panel(
+        panel = Panel(
             context_text, title="Context", title_align="left", border_style="dim white"
         )
+        self._panel_cache['context'] = (key, panel)
+        return panel
 
     def create_burn_rate_panel(self, burn_rate: float) -> Panel:
         """Create output token rate panel (tokens per second)."""
+        # The display only shows one decimal, so key on that granularity
+        key = (round(burn_rate, 1),)
+        cached = self._panel_cache.get('burn_rate')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         if burn_rate == 0:
             burn_text = "[dim]No recent activity[/dim]"
         else:
@@ -176,18 +347,16 @@ class DashboardUI:
             burn_text = f"""[bold white]{burn_rate:,.1f}[/bold white] [dim cyan]tok/sec[/dim cyan]
 {level}"""
 
-        return Panel(
+        panel = Panel(
             burn_text, title="Output Rate", title_align="left", border_style="dim white"
         )
+        self._panel_cache['burn_rate'] = (key, panel)
+        return panel
 
     def create_session_time_panel(self, session: SessionData) -> Panel:
         """Create session time progress panel with 5-hour maximum."""
         if not session.start_time:
-            return Panel(
-                "[dim]No session timing data[/dim]",
-                title="Session Time",
-                border_style="dim white",
-            )
+            return self._empty_session_time
 
         # Calculate duration from start_time to now (updates continuously even when idle)
         current_time = datetime.now()
@@ -202,43 +371,61 @@ class DashboardUI:
         # Format duration display using hours and minutes format
         duration_display = TimeUtils.format_duration_hm(duration_ms)
 
+        # The display changes at minute/percent granularity, not per tick
+        key = (duration_display, int(percentage))
+        cached = self._panel_cache.get('session_time')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         # Create progress bar with time-based colors
         progress_bar = self.create_compact_progress_bar(percentage, 12)
         time_color = self.get_time_color(percentage)
 
-        time_text = f"""[dim]Duration:[/dim] [bold white]{duration_display}[/bold white]
-[dim]Max:[/dim] [bold white]{max_hours:.0f}h[/bold white]
-[{time_color}]{progress_bar}[/{time_color}]"""
+        time_text = Text.assemble(
+            ("Duration:", "dim"), (f" {duration_display}", "bold white"), "\n",
+            ("Max:", "dim"), (f" {max_hours:.0f}h", "bold white"), "\n",
+            (progress_bar, time_color),
+        )
 
-        return Panel(
+        panel = Panel(
             time_text,
             title="Session Time",
             title_align="left",
             border_style="dim white",
         )
+        self._panel_cache['session_time'] = (key, panel)
+        return panel
 
     def create_recent_file_panel(self, recent_file: Optional[Any]) -> Panel:
         """Create recent file info panel."""
         if not recent_file:
-            return Panel(
-                "[dim]No recent files[/dim]", title="Recent", border_style="dim white"
-            )
+            return self._empty_recent
 
         # Truncate file name if too long
         file_name = recent_file.file_name
         if len(file_name) > 20:
             file_name = "..." + file_name[-17:]
 
+        duration_ms = (
+            recent_file.time_data.duration_ms if recent_file.time_data else None
+        )
+        key = (file_name, recent_file.model_id, duration_ms)
+        cached = self._panel_cache.get('recent_file')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         file_text = f"""[dim]File:[/dim] [bold white]{file_name}[/bold white]
 [dim]Model:[/dim] [bold white]{recent_file.model_id[:15]}[/bold white]"""
 
-        if recent_file.time_data and recent_file.time_data.duration_ms:
-            duration = self.format_duration(recent_file.time_data.duration_ms)
+        if duration_ms:
+            duration = self.format_duration(duration_ms)
             file_text += f"\n[dim]Duration:[/dim] [bold white]{duration}[/bold white]"
 
-        return Panel(
+        panel = Panel(
             file_text, title="Recent", title_align="left", border_style="dim white"
         )
+        self._panel_cache['recent_file'] = (key, panel)
+        return panel
 
     def create_dashboard_layout(
         self,
@@ -300,58 +487,69 @@ class DashboardUI:
 
         return layout
 
+    # Prefilled bar segments; slicing a constant is one memcpy versus two
+    # string-multiply allocations per redraw
+    _BAR_FULL = "█" * 64
+    _BAR_HALF = "▌" * 64
+    _BAR_EMPTY = "░" * 64
+
+    def _bar_body(self, fill: str, width: int, filled: int) -> str:
+        """Get a bar string of `filled` fill characters padded to `width`.
+
+        Bodies for each (fill, width) pair are enumerated on first use —
+        there are only width + 1 of them — so steady-state frames index a
+        list instead of building the string at all.
+        """
+        bodies = self._bar_bodies.get((fill, width))
+        if bodies is None:
+            bodies = [
+                fill * i + self._BAR_EMPTY[:width - i] for i in range(width + 1)
+            ]
+            self._bar_bodies[(fill, width)] = bodies
+        # Percentages outside 0-100 are valid input (context overflow);
+        # clamp so they render a full or empty bar instead of indexing
+        # past the table
+        if filled < 0:
+            filled = 0
+        elif filled > width:
+            filled = width
+        return bodies[filled]
+
     def create_progress_bar(self, percentage: float, width: int = 30) -> str:
         """Create a text-based progress bar."""
         filled = int(width * percentage / 100)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"[{bar}] {percentage:.1f}%"
+        return f"[{self._bar_body(self._BAR_FULL[0], width, filled)}] {percentage:.1f}%"
 
     def create_compact_progress_bar(self, percentage: float, width: int = 20) -> str:
         """Create a compact progress bar for space-efficient display."""
         filled = int(width * percentage / 100)
-        bar = "▌" * filled + "░" * (width - filled)
-        return f"{bar} {percentage:.0f}%"
+        return f"{self._bar_body(self._BAR_HALF[0], width, filled)} {percentage:.0f}%"
+
+    # Threshold bisection replaces the if/elif comparison chains; the
+    # colors are indexed by how many thresholds the percentage has passed
+    _COST_THRESHOLDS = (50, 75, 90)
+    _CONTEXT_THRESHOLDS = (70, 85, 95)
+    _LEVEL_COLORS = ("green", "orange", "yellow", "red")
 
     def get_cost_color(self, percentage: float) -> str:
         """Get color for cost based on percentage."""
-        if percentage >= 90:
-            return "red"
-        elif percentage >= 75:
-            return "yellow"
-        elif percentage >= 50:
-            return "orange"
-        else:
-            return "green"
+        return self._LEVEL_COLORS[bisect_right(self._COST_THRESHOLDS, percentage)]
 
     def get_context_color(self, percentage: float) -> str:
         """Get color for context window based on percentage."""
-        if percentage >= 95:
-            return "red"
-        elif percentage >= 85:
-            return "yellow"
-        elif percentage >= 70:
-            return "orange"
-        else:
-            return "green"
+        return self._LEVEL_COLORS[bisect_right(self._CONTEXT_THRESHOLDS, percentage)]
 
     def get_time_color(self, percentage: float) -> str:
         """Get color for session time based on percentage of 5-hour max."""
-        if percentage >= 90:
-            return "red"
-        elif percentage >= 75:
-            return "yellow"
-        elif percentage >= 50:
-            return "orange"
-        else:
-            return "green"
+        return self._LEVEL_COLORS[bisect_right(self._COST_THRESHOLDS, percentage)]
 
     def format_duration(self, milliseconds: int) -> str:
         """Format duration in milliseconds to hours and minutes format."""
         return TimeUtils.format_duration_hm(milliseconds)
 
     def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        """Clear the terminal screen without spawning a shell."""
+        self.console.clear()
 
     def create_simple_table(self, data: Dict[str, Any]) -> Table:
         """Create a simple data table for fallback rendering."""
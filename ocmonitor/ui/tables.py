@@ -1,19 +1,44 @@
 """Rich table formatting for OpenCode Monitor."""
 
-from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Union
 from decimal import Decimal
 from rich.console import Console
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from rich.panel import Panel
 from rich.columns import Columns
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
 
+from ..config import scaled_cost_to_decimal
 from ..models.session import SessionData, TokenUsage
 from ..models.analytics import DailyUsage, WeeklyUsage, MonthlyUsage, ModelUsageStats
 from ..utils.time_utils import TimeUtils
 
 
+# Shared table chrome with pre-parsed Style objects, so rebuilding a
+# table every refresh does not re-parse the same style strings
+_TABLE_KWARGS = {
+    'show_header': True,
+    'header_style': Style(bold=True, color="blue"),
+    'title_style': Style(bold=True, color="magenta"),
+}
+
+
+@lru_cache(maxsize=4096)
+def _trunc(value: str, limit: int) -> str:
+    """Truncate to `limit` characters with an ellipsis, once per string.
+
+    Model ids, file names and titles repeat heavily across rows, so the
+    memo turns the per-row len check and slice into a dict hit.
+    """
+    return value if len(value) <= limit else value[:limit - 3] + "..."
+
+
 class TableFormatter:
     """Formatter for creating Rich tables."""
 
@@ -24,12 +49,23 @@ class TableFormatter:
             console: Rich console instance. If None, creates a new one.
         """
         self.console = console or Console()
+        # When output is piped, styles are stripped at render anyway, so
+        # per-row color math and Text wrappers can be skipped up front
+        self._plain = not self.console.is_terminal
+
+    def _styled(self, value: str, style: str):
+        """Wrap a cell value in a styled Text, or pass it through when
+        the console cannot display styles."""
+        if self._plain:
+            return value
+        return Text(value, style=style)
 
     def format_number(self, number: int) -> str:
         """Format numbers with thousands separators."""
-        return f"{number:,}"
+        # format() skips the f-string template machinery
+        return format(number, ',d')
 
-    def format_currency(self, amount: Decimal) -> str:
+    def format_currency(self, amount: Union[Decimal, float]) -> str:
         """Format currency amounts."""
         return f"${amount:.2f}"
 
@@ -40,29 +76,22 @@ class TableFormatter:
         percentage = (value / total) * 100
         return f"{percentage:.1f}%"
 
+    # Quota-usage thresholds bisected into a color lookup, matching the
+    # dashboard's classifier
+    _COST_THRESHOLDS = (50, 75, 90)
+    _COST_COLORS = ("green", "orange", "yellow", "red")
+
     def get_cost_color(self, cost: Decimal, quota: Optional[Decimal] = None) -> str:
         """Get color for cost based on quota."""
-        if quota is None:
+        if quota is None or self._plain:
             return "white"
 
         percentage = float(cost / quota) * 100
-        if percentage >= 90:
-            return "red"
-        elif percentage >= 75:
-            return "yellow"
-        elif percentage >= 50:
-            return "orange"
-        else:
-            return "green"
+        return self._COST_COLORS[bisect_right(self._COST_THRESHOLDS, percentage)]
 
     def create_sessions_table(self, sessions: List[SessionData], pricing_data: Dict[str, Any]) -> Table:
         """Create a table for multiple sessions."""
-        table = Table(
-            title="OpenCode Sessions Summary",
-            show_header=True,
-            header_style="bold blue",
-            title_style="bold magenta"
-        )
+        table = Table(title="OpenCode Sessions Summary", **_TABLE_KWARGS)
 
         # Add columns
         table.add_column("Started", style="cyan", no_wrap=True)
@@ -76,27 +105,76 @@ class TableFormatter:
         table.add_column("Cost", justify="right", style="red")
         table.add_column("Speed", justify="right", style="cyan")
 
-        # Sort sessions by start time
-        sorted_sessions = sorted(sessions, key=lambda s: s.start_time or s.session_id)
+        # Sort sessions by start time; decorate once so the comparisons
+        # never mix datetimes with session-id strings and the key lambda
+        # is not re-invoked O(N log N) times
+        keyed = [(session.start_time or datetime.min, session) for session in sessions]
+        keyed.sort(key=itemgetter(0))
+        sorted_sessions = [session for _, session in keyed]
+
+        # Stream rows straight into the table; the generator keeps only
+        # the row being built plus the running totals
+        totals = [0, 0, 0, 0, 0, 0, 0]
+        for row in self.iter_session_rows(sorted_sessions, pricing_data, totals):
+            table.add_row(*row)
+        (total_interactions, total_input_tokens, total_output_sum,
+         total_tokens_sum, total_cost_scaled, total_duration_ms,
+         total_output_tokens) = totals
 
-        total_interactions = 0
-        total_tokens = TokenUsage()
-        total_cost = Decimal('0.0')
-        total_duration_ms = 0
-        total_output_tokens = 0
-
-        for session in sorted_sessions:
-            session_cost = session.calculate_total_cost(pricing_data)
-            session_tokens = session.total_tokens
-
-            # Update totals
-            total_interactions += session.interaction_count
-            total_tokens.input += session_tokens.input
-            total_tokens.output += session_tokens.output
-            total_tokens.cache_write += session_tokens.cache_write
-            total_tokens.cache_read += session_tokens.cache_read
-            total_cost += session_cost
+        # Add separator and totals
+        table.add_section()
+        # Calculate aggregate speed for totals
+        if total_duration_ms > 0 and total_output_tokens > 0:
+            total_speed = total_output_tokens * 1000 / total_duration_ms
+            total_speed_text = f"{total_speed:.1f} t/s"
+        else:
+            total_speed_text = "-"
+
+        table.add_row(
+            Text("TOTALS", style="bold white"),
+            "",
+            "",  # Empty session column
+            Text(f"{len(sorted_sessions)} sessions", style="bold white"),
+            Text(self.format_number(total_interactions), style="bold green"),
+            Text(self.format_number(total_input_tokens), style="bold blue"),
+            Text(self.format_number(total_output_sum), style="bold blue"),
+            Text(self.format_number(total_tokens_sum), style="bold blue"),
+            Text(self.format_currency(scaled_cost_to_decimal(total_cost_scaled)), style="bold red"),
+            Text(total_speed_text, style="bold cyan")
+        )
+
+        return table
+
+    def iter_session_rows(self, sessions: List[SessionData], pricing_data: Dict[str, Any],
+                          totals: Optional[list] = None):
+        """Yield one formatted row tuple per (session, model) pair.
+
+        Rows are produced on demand so callers can feed them to a table,
+        pager or any other sink without materializing the full list.
+        `totals`, when given, is a 7-slot list accumulating interactions,
+        input/output/total tokens, scaled cost, duration and output
+        tokens in a single streaming pass.
+
+        Args:
+            sessions: Sessions to emit, in display order
+            pricing_data: Model pricing information
+            totals: Optional mutable accumulator for the totals row
 
+        Yields:
+            Tuples of renderables matching the sessions-table columns
+        """
+        if totals is None:
+            totals = [0, 0, 0, 0, 0, 0, 0]
+
+        # Per-row helpers bound once; LOAD_FAST beats repeated attribute
+        # lookups on the ~10-calls-per-row path
+        fmt = self.format_number
+        fmt_cur = self.format_currency
+        fmt_dur = TimeUtils.format_duration_hm
+        color_of = self.get_cost_color
+        styled = self._styled
+
+        for session in sessions:
             # Get model breakdown for session
             model_breakdown = session.get_model_breakdown(pricing_data)
 
@@ -105,80 +183,55 @@ class TableFormatter:
                 # Show session info only for first model
                 if i == 0:
                     start_time = session.start_time.strftime('%Y-%m-%d %H:%M:%S') if session.start_time else 'N/A'
-                    duration = self._format_duration(session.duration_ms) if session.duration_ms else 'N/A'
-                    session_display = session.display_title
-                    # Truncate if too long for display
-                    if len(session_display) > 35:
-                        session_display = session_display[:32] + "..."
+                    duration = fmt_dur(session.duration_ms) if session.duration_ms else 'N/A'
+                    session_display = _trunc(session.display_title, 35)
                 else:
                     start_time = ""
                     duration = ""
                     session_display = ""
 
                 # Format model name
-                model_text = Text(model)
-                if len(model) > 25:
-                    model_text = Text(f"{model[:22]}...")
+                model_text = _trunc(model, 25)
 
                 # Get cost color
-                cost_color = self.get_cost_color(stats['cost'])
+                cost_color = color_of(stats['cost'])
+
+                # Update totals
+                tokens = stats['tokens']
+                totals[0] += stats['files']
+                totals[1] += tokens.input
+                totals[2] += tokens.output
+                totals[3] += tokens.total
+                totals[4] += stats['cost_scaled']
 
                 # Calculate speed (output tokens per second)
                 duration_ms = stats.get('duration_ms', 0)
-                output_tokens = stats['tokens'].output
-                total_duration_ms += duration_ms
-                total_output_tokens += output_tokens
+                output_tokens = tokens.output
+                totals[5] += duration_ms
+                totals[6] += output_tokens
                 if duration_ms > 0 and output_tokens > 0:
-                    speed = output_tokens / (duration_ms / 1000)
+                    # Single division: tokens/ms scaled to per-second
+                    speed = output_tokens * 1000 / duration_ms
                     speed_text = f"{speed:.1f} t/s"
                 else:
                     speed_text = "-"
 
-                table.add_row(
+                yield (
                     start_time,
                     duration,
                     session_display,
                     model_text,
-                    self.format_number(stats['files']),
-                    self.format_number(stats['tokens'].input),
-                    self.format_number(stats['tokens'].output),
-                    self.format_number(stats['tokens'].total),
-                    Text(self.format_currency(stats['cost']), style=cost_color),
+                    fmt(stats['files']),
+                    fmt(tokens.input),
+                    fmt(tokens.output),
+                    fmt(tokens.total),
+                    styled(fmt_cur(stats['cost']), cost_color),
                     speed_text
                 )
 
-        # Add separator and totals
-        table.add_section()
-        # Calculate aggregate speed for totals
-        if total_duration_ms > 0 and total_output_tokens > 0:
-            total_speed = total_output_tokens / (total_duration_ms / 1000)
-            total_speed_text = f"{total_speed:.1f} t/s"
-        else:
-            total_speed_text = "-"
-
-        table.add_row(
-            Text("TOTALS", style="bold white"),
-            "",
-            "",  # Empty session column
-            Text(f"{len(sorted_sessions)} sessions", style="bold white"),
-            Text(self.format_number(total_interactions), style="bold green"),
-            Text(self.format_number(total_tokens.input), style="bold blue"),
-            Text(self.format_number(total_tokens.output), style="bold blue"),
-            Text(self.format_number(total_tokens.total), style="bold blue"),
-            Text(self.format_currency(total_cost), style="bold red"),
-            Text(total_speed_text, style="bold cyan")
-        )
-
-        return table
-
     def create_session_table(self, session: SessionData, pricing_data: Dict[str, Any]) -> Table:
         """Create a table for a single session."""
-        table = Table(
-            title=f"Session: {session.display_title}",
-            show_header=True,
-            header_style="bold blue",
-            title_style="bold magenta"
-        )
+        table = Table(title=f"Session: {session.display_title}", **_TABLE_KWARGS)
 
         # Add columns
         table.add_column("File", style="cyan", max_width=30)
@@ -191,32 +244,46 @@ class TableFormatter:
         table.add_column("Cost", justify="right", style="red")
         table.add_column("Duration", justify="right", style="cyan")
 
-        total_cost = Decimal('0.0')
-        total_tokens = TokenUsage()
+        # Plain int accumulators; TokenUsage.__add__ would allocate a new
+        # model instance per file
+        total_cost_scaled = 0
+        total_input = 0
+        total_output = 0
+        total_cache_write = 0
+        total_cache_read = 0
+
+        add_row = table.add_row
+        fmt = self.format_number
+        fmt_cur = self.format_currency
+        fmt_dur = TimeUtils.format_duration_hm
+        color_of = self.get_cost_color
+        styled = self._styled
 
         for file in session.files:
-            cost = file.calculate_cost(pricing_data)
-            total_cost += cost
-            total_tokens.input += file.tokens.input
-            total_tokens.output += file.tokens.output
-            total_tokens.cache_write += file.tokens.cache_write
-            total_tokens.cache_read += file.tokens.cache_read
+            cost_scaled = file.calculate_cost_scaled(pricing_data)
+            cost = scaled_cost_to_decimal(cost_scaled)
+            total_cost_scaled += cost_scaled
+            tokens = file.tokens
+            total_input += tokens.input
+            total_output += tokens.output
+            total_cache_write += tokens.cache_write
+            total_cache_read += tokens.cache_read
 
             duration = ""
             if file.time_data and file.time_data.duration_ms:
-                duration = self._format_duration(file.time_data.duration_ms)
+                duration = fmt_dur(file.time_data.duration_ms)
 
-            cost_color = self.get_cost_color(cost)
+            cost_color = color_of(cost)
 
-            table.add_row(
-                Text(file.file_name[:27] + "..." if len(file.file_name) > 30 else file.file_name),
+            add_row(
+                _trunc(file.file_name, 30),
                 file.model_id,
-                self.format_number(file.tokens.input),
-                self.format_number(file.tokens.output),
-                self.format_number(file.tokens.cache_write),
-                self.format_number(file.tokens.cache_read),
-                self.format_number(file.tokens.total),
-                Text(self.format_currency(cost), style=cost_color),
+                fmt(tokens.input),
+                fmt(tokens.output),
+                fmt(tokens.cache_write),
+                fmt(tokens.cache_read),
+                fmt(tokens.total),
+                styled(fmt_cur(cost), cost_color),
                 duration
             )
 
@@ -225,12 +292,12 @@ class TableFormatter:
         table.add_row(
             Text("TOTALS", style="bold white"),
             "",
-            Text(self.format_number(total_tokens.input), style="bold blue"),
-            Text(self.format_number(total_tokens.output), style="bold blue"),
-            Text(self.format_number(total_tokens.cache_write), style="bold green"),
-            Text(self.format_number(total_tokens.cache_read), style="bold green"),
-            Text(self.format_number(total_tokens.total), style="bold blue"),
-            Text(self.format_currency(total_cost), style="bold red"),
+            Text(self.format_number(total_input), style="bold blue"),
+            Text(self.format_number(total_output), style="bold blue"),
+            Text(self.format_number(total_cache_write), style="bold green"),
+            Text(self.format_number(total_cache_read), style="bold green"),
+            Text(self.format_number(total_input + total_output + total_cache_write + total_cache_read), style="bold blue"),
+            Text(self.format_currency(scaled_cost_to_decimal(total_cost_scaled)), style="bold red"),
             ""
         )
 
@@ -238,12 +305,7 @@ class TableFormatter:
 
     def create_daily_table(self, daily_usage: List[DailyUsage], pricing_data: Dict[str, Any]) -> Table:
         """Create a table for daily usage breakdown."""
-        table = Table(
-            title="Daily Usage Breakdown",
-            show_header=True,
-            header_style="bold blue",
-            title_style="bold magenta"
-        )
+        table = Table(title="Daily Usage Breakdown", **_TABLE_KWARGS)
 
         # Add columns
         table.add_column("Date", style="cyan", no_wrap=True)
@@ -255,38 +317,48 @@ class TableFormatter:
         table.add_column("Cost", justify="right", style="red")
         table.add_column("Models", style="yellow")
 
+        # Accumulate plain ints rather than building a new TokenUsage per
+        # day; only the cost stays Decimal (each day's value is memoized)
         total_sessions = 0
         total_interactions = 0
-        total_tokens = TokenUsage()
-        total_cost = Decimal('0.0')
-
+        total_input = 0
+        total_output = 0
+        total_tokens_sum = 0
+        # Display-only total rounded to cents, so a float accumulator is
+        # plenty and skips a Decimal add per day
+        total_cost = 0.0
+
+        add_row = table.add_row
+        fmt = self.format_number
+        fmt_cur = self.format_currency
+        color_of = self.get_cost_color
+        styled = self._styled
         for day in daily_usage:
             day_cost = day.calculate_total_cost(pricing_data)
             day_tokens = day.total_tokens
 
             total_sessions += len(day.sessions)
             total_interactions += day.total_interactions
-            total_tokens.input += day_tokens.input
-            total_tokens.output += day_tokens.output
-            total_tokens.cache_write += day_tokens.cache_write
-            total_tokens.cache_read += day_tokens.cache_read
-            total_cost += day_cost
+            total_input += day_tokens.input
+            total_output += day_tokens.output
+            total_tokens_sum += day_tokens.total
+            total_cost += float(day_cost)
 
             models_text = ", ".join(day.models_used[:3])
             if len(day.models_used) > 3:
                 models_text += f" (+{len(day.models_used) - 3} more)"
 
-            cost_color = self.get_cost_color(day_cost)
+            cost_color = color_of(day_cost)
 
-            table.add_row(
+            add_row(
                 day.date.strftime('%Y-%m-%d'),
-                self.format_number(len(day.sessions)),
-                self.format_number(day.total_interactions),
-                self.format_number(day_tokens.input),
-                self.format_number(day_tokens.output),
-                self.format_number(day_tokens.total),
-                Text(self.format_currency(day_cost), style=cost_color),
-                Text(models_text, style="yellow")
+                fmt(len(day.sessions)),
+                fmt(day.total_interactions),
+                fmt(day_tokens.input),
+                fmt(day_tokens.output),
+                fmt(day_tokens.total),
+                styled(fmt_cur(day_cost), cost_color),
+                models_text
             )
 
         # Add totals
@@ -295,9 +367,9 @@ class TableFormatter:
             Text("TOTALS", style="bold white"),
             Text(self.format_number(total_sessions), style="bold green"),
             Text(self.format_number(total_interactions), style="bold green"),
-            Text(self.format_number(total_tokens.input), style="bold blue"),
-            Text(self.format_number(total_tokens.output), style="bold blue"),
-            Text(self.format_number(total_tokens.total), style="bold blue"),
+            Text(self.format_number(total_input), style="bold blue"),
+            Text(self.format_number(total_output), style="bold blue"),
+            Text(self.format_number(total_tokens_sum), style="bold blue"),
             Text(self.format_currency(total_cost), style="bold red"),
             ""
         )
@@ -306,12 +378,7 @@ class TableFormatter:
 
     def create_model_breakdown_table(self, model_stats: List[ModelUsageStats]) -> Table:
         """Create a table for model usage breakdown."""
-        table = Table(
-            title="Model Usage Breakdown",
-            show_header=True,
-            header_style="bold blue",
-            title_style="bold magenta"
-        )
+        table = Table(title="Model Usage Breakdown", **_TABLE_KWARGS)
 
         # Add columns
         table.add_column("Model", style="yellow", max_width=30)
@@ -324,11 +391,21 @@ class TableFormatter:
         table.add_column("Cost %", justify="right", style="red")
         table.add_column("Speed", justify="right", style="cyan")
 
-        total_cost = sum(model.total_cost for model in model_stats)
-
+        # The total is only the percentage denominator, so sum the cached
+        # float views instead of doing N Decimal additions plus a cast
+        # per row
+        total_cost = sum(model.total_cost_float for model in model_stats)
+        # Fold the per-row percentage division into one precomputed scale
+        pct_scale = 100.0 / total_cost if total_cost else 0.0
+
+        add_row = table.add_row
+        fmt = self.format_number
+        fmt_cur = self.format_currency
+        color_of = self.get_cost_color
+        styled = self._styled
         for model in model_stats:
-            cost_percentage = self.format_percentage(float(model.total_cost), float(total_cost))
-            cost_color = self.get_cost_color(model.total_cost)
+            cost_percentage = f"{model.total_cost_float * pct_scale:.1f}%"
+            cost_color = color_of(model.total_cost)
 
             # Format speed
             speed = model.avg_output_rate
@@ -337,15 +414,15 @@ class TableFormatter:
             else:
                 speed_text = f"{speed:.1f} t/s"
 
-            table.add_row(
-                Text(model.model_name[:27] + "..." if len(model.model_name) > 30 else model.model_name),
-                self.format_number(model.total_sessions),
-                self.format_number(model.total_interactions),
-                self.format_number(model.total_tokens.input),
-                self.format_number(model.total_tokens.output),
-                self.format_number(model.total_tokens.total),
-                Text(self.format_currency(model.total_cost), style=cost_color),
-                Text(cost_percentage, style=cost_color),
+            add_row(
+                _trunc(model.model_name, 30),
+                fmt(model.total_sessions),
+                fmt(model.total_interactions),
+                fmt(model.total_tokens.input),
+                fmt(model.total_tokens.output),
+                fmt(model.total_tokens.total),
+                styled(fmt_cur(model.total_cost), cost_color),
+                styled(cost_percentage, cost_color),
                 speed_text
             )
 
@@ -367,25 +444,26 @@ class TableFormatter:
             return Panel("No sessions found", title="Summary", title_align="left")
 
         total_sessions = len(sessions)
-        total_interactions = sum(session.interaction_count for session in sessions)
-        total_tokens = TokenUsage()
-        total_cost = Decimal('0.0')
+        total_interactions = 0
+        total_tokens_sum = 0
+        total_cost_scaled = 0
         models_used = set()
 
+        # One pass over the memoized per-model stats covers interactions,
+        # tokens, cost and the model set at once
         for session in sessions:
-            session_tokens = session.total_tokens
-            total_tokens.input += session_tokens.input
-            total_tokens.output += session_tokens.output
-            total_tokens.cache_write += session_tokens.cache_write
-            total_tokens.cache_read += session_tokens.cache_read
-            total_cost += session.calculate_total_cost(pricing_data)
-            models_used.update(session.models_used)
+            for model, stats in session.get_model_breakdown(pricing_data).items():
+                models_used.add(model)
+                total_interactions += stats['files']
+                total_tokens_sum += stats['tokens'].total
+                total_cost_scaled += stats['cost_scaled']
+        total_cost = scaled_cost_to_decimal(total_cost_scaled)
 
         # Create summary text
         summary_lines = [
             f"[bold]Sessions:[/bold] {self.format_number(total_sessions)}",
             f"[bold]Interactions:[/bold] {self.format_number(total_interactions)}",
-            f"[bold]Total Tokens:[/bold] {self.format_number(total_tokens.total)}",
+            f"[bold]Total Tokens:[/bold] {self.format_number(total_tokens_sum)}",
             f"[bold]Total Cost:[/bold] {self.format_currency(total_cost)}",
             f"[bold]Models Used:[/bold] {len(models_used)}"
         ]
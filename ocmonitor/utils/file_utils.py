@@ -3,12 +3,52 @@
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Generator
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from ..models.session import SessionData, InteractionFile, TokenUsage, TimeData
 
+# Model-name normalization patterns, compiled once at import so the hot
+# per-file parse path skips the re-cache lookup per substitution
+_RE_DATE_SUFFIX = re.compile(r'-\d{8}$')
+_RE_VERSION_SEP = re.compile(r'-(\d+)-(\d+)(?![.\d])')
+_RE_CLAUDE_VERSION = re.compile(r'claude-(opus|sonnet|haiku)-(\d+)-(\d+)')
+_RE_GPT_VERSION = re.compile(r'gpt-(\d+)-(\d+)')
+_RE_KIMI_VERSION = re.compile(r'kimi-k-(\d+)')
+
+# Shared read-only default for missing nested objects, so the per-file
+# parse path never allocates throwaway dicts
+_EMPTY: Dict[str, Any] = {}
+
+
+@lru_cache(maxsize=1024)
+def _validate_structure_cached(path_str: str, dir_mtime_ns: int) -> bool:
+    """Probe body for validate_session_structure, keyed on directory mtime.
+
+    Adding or removing files bumps the directory mtime, so a changed
+    session re-validates while repeat checks on unchanged dirs are a
+    dict hit instead of up to three file reads.
+    """
+    json_files = FileProcessor.find_json_files(Path(path_str))
+    if not json_files:
+        return False
+
+    # Check if at least one file has valid structure
+    for json_file in json_files[:3]:  # Check first 3 files
+        data = FileProcessor.load_json_file(json_file)
+        if data and ('tokens' in data or 'modelID' in data):
+            return True
+
+    return False
+
 
 class FileProcessor:
     """Handles file processing and session discovery."""
@@ -23,19 +63,21 @@ class FileProcessor:
         Returns:
             List of session directory paths sorted by modification time (newest first)
         """
-        base_dir = Path(base_path)
-        if not base_dir.exists():
+        # scandir hands back mtime from the directory read itself, so no
+        # per-entry stat syscall and no Path object for filtered entries
+        try:
+            with os.scandir(base_path) as entries:
+                keyed = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries
+                    if entry.name.startswith('ses_') and entry.is_dir()
+                ]
+        except OSError:
             return []
 
-        # Find all directories that start with 'ses_'
-        session_dirs = [
-            d for d in base_dir.iterdir()
-            if d.is_dir() and d.name.startswith('ses_')
-        ]
-
         # Sort by modification time (most recent first)
-        session_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return session_dirs
+        keyed.sort(reverse=True)
+        return [Path(path) for _, path in keyed]
 
     @staticmethod
     def find_json_files(directory: Path) -> List[Path]:
@@ -47,12 +89,18 @@ class FileProcessor:
         Returns:
             List of JSON file paths sorted by modification time (newest first)
         """
-        if not directory.exists() or not directory.is_dir():
+        try:
+            with os.scandir(directory) as entries:
+                keyed = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.json')
+                ]
+        except OSError:
             return []
 
-        json_files = list(directory.glob("*.json"))
-        json_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return json_files
+        keyed.sort(reverse=True)
+        return [Path(path) for _, path in keyed]
 
     @staticmethod
     def load_json_file(file_path: Path) -> Optional[Dict[str, Any]]:
@@ -65,12 +113,31 @@ class FileProcessor:
             Parsed JSON data or None if failed
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError, PermissionError, UnicodeDecodeError):
+            # Raw fd I/O sized by fstat: one read call per file and none
+            # of the buffered-IO object setup (lseek/isatty) that open()
+            # pays for on every small file
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                raw = os.read(fd, size if size > 0 else 65536)
+                if len(raw) < size:
+                    # Short reads are possible in theory; finish the file
+                    chunks = [raw]
+                    while chunk := os.read(fd, 65536):
+                        chunks.append(chunk)
+                    raw = b''.join(chunks)
+            finally:
+                os.close(fd)
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw)
+        except (ValueError, OSError):
+            # Covers JSON/Unicode decode errors (ValueError subclasses)
+            # and missing/unreadable files
             return None
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _extract_model_name(model_id: str) -> str:
         """Extract model name from fully qualified model ID.
         
@@ -85,6 +152,7 @@ class FileProcessor:
         return FileProcessor._normalize_model_name(model_id)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _normalize_model_name(model_id: str) -> str:
         """Normalize model name for flexible pricing lookup.
         
@@ -102,24 +170,24 @@ class FileProcessor:
         model_id = model_id.lower()
         
         # Strip date suffixes like -20250514, -20251101, -20241001, etc.
-        model_id = re.sub(r'-\d{8}$', '', model_id)
+        model_id = _RE_DATE_SUFFIX.sub('', model_id)
         
         # Normalize version separators: -X-Y to -X.Y
         # E.g., claude-opus-4-5 -> claude-opus-4.5
         # Be careful not to create double dots or mess up existing dots
-        model_id = re.sub(r'-(\d+)-(\d+)(?![.\d])', r'-\1.\2', model_id)
+        model_id = _RE_VERSION_SEP.sub(r'-\1.\2', model_id)
         
         # Handle special cases for known model families
         
         # Claude family: claude-opus-4-5 -> claude-opus-4.5, claude-sonnet-4-5 -> claude-sonnet-4.5
-        model_id = re.sub(r'claude-(opus|sonnet|haiku)-(\d+)-(\d+)', r'claude-\1-\2.\3', model_id)
+        model_id = _RE_CLAUDE_VERSION.sub(r'claude-\1-\2.\3', model_id)
         
         # Gemini family: gemini-3-pro -> gemini-3-pro (keep as is)
         # GPT family: gpt-5-1 -> gpt-5.1, gpt-5-2 -> gpt-5.2
-        model_id = re.sub(r'gpt-(\d+)-(\d+)', r'gpt-\1.\2', model_id)
+        model_id = _RE_GPT_VERSION.sub(r'gpt-\1.\2', model_id)
         
         # Kimi family: kimi-k-2 -> kimi-k2 (remove middle dash)
-        model_id = re.sub(r'kimi-k-(\d+)', r'kimi-k\1', model_id)
+        model_id = _RE_KIMI_VERSION.sub(r'kimi-k\1', model_id)
         
         return model_id
 
@@ -136,8 +204,10 @@ class FileProcessor:
         if not path_str:
             return "Unknown"
         
-        path = Path(path_str)
-        return path.name if path.name else "Unknown"
+        # Plain string ops: this runs per interaction and only the last
+        # component is wanted, so skip the Path parse/allocation
+        name = path_str.rstrip('/\\').rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
+        return name or "Unknown"
 
     @staticmethod
     def get_opencode_storage_path() -> Optional[Path]:
@@ -148,8 +218,8 @@ class FileProcessor:
         """
         # Try to get from configuration first
         try:
-            from ..config import config_manager
-            storage_path = Path(config_manager.config.paths.opencode_storage_dir)
+            from ..config import get_config_manager
+            storage_path = Path(get_config_manager().config.paths.opencode_storage_dir)
             if storage_path.exists():
                 return storage_path
         except ImportError:
@@ -164,6 +234,51 @@ class FileProcessor:
         
         return None
 
+    # Session-id -> title file index, built from one walk of the storage
+    # tree on first lookup instead of probing every project directory per
+    # session
+    _title_index: Optional[Dict[str, Path]] = None
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _session_storage_path() -> Optional[Path]:
+        """Resolve the session storage directory once per process."""
+        storage_path = FileProcessor.get_opencode_storage_path()
+        if not storage_path:
+            return None
+
+        session_storage = storage_path / "session"
+        if not session_storage.exists():
+            return None
+        return session_storage
+
+    @classmethod
+    def invalidate_storage_cache(cls) -> None:
+        """Drop the memoized storage path and session-title index.
+
+        For tests and for callers that change the configured storage
+        location mid-process; normal runs never need it.
+        """
+        cls._session_storage_path.cache_clear()
+        cls._title_index = None
+
+    @classmethod
+    def _build_title_index(cls, session_storage: Path) -> Dict[str, Path]:
+        """Map session ids to their title files across all project dirs."""
+        index: Dict[str, Path] = {}
+        try:
+            with os.scandir(session_storage) as projects:
+                for project_dir in projects:
+                    if not project_dir.is_dir():
+                        continue
+                    with os.scandir(project_dir.path) as entries:
+                        for entry in entries:
+                            if entry.name.endswith('.json'):
+                                index[entry.name[:-5]] = Path(entry.path)
+        except OSError:
+            pass
+        return index
+
     @staticmethod
     def find_session_title(session_id: str) -> Optional[str]:
         """Find and load session title from OpenCode storage.
@@ -174,25 +289,42 @@ class FileProcessor:
         Returns:
             Session title or None if not found
         """
-        storage_path = FileProcessor.get_opencode_storage_path()
-        if not storage_path:
+        session_storage = FileProcessor._session_storage_path()
+        if not session_storage:
             return None
-        
-        session_storage = storage_path / "session"
-        if not session_storage.exists():
-            return None
-        
-        # Search through all project directories (including global)
-        for project_dir in session_storage.iterdir():
-            if not project_dir.is_dir():
-                continue
 
-            session_file = project_dir / f"{session_id}.json"
-            if session_file.exists():
-                session_data = FileProcessor.load_json_file(session_file)
-                if session_data and "title" in session_data:
-                    return session_data["title"]
+        index = FileProcessor._title_index
+        if index is None:
+            index = FileProcessor._title_index = \
+                FileProcessor._build_title_index(session_storage)
+
+        session_file = index.get(session_id)
+        if session_file is None:
+            # Sessions created after the index was built (e.g. while the
+            # live monitor runs) land here; probe directly and remember
+            # the result so the next scan skips the project walk. Loading
+            # straight away saves the exists() stat per project miss:
+            # load_json_file returns None for absent files
+            target = f"{session_id}.json"
+            try:
+                with os.scandir(session_storage) as projects:
+                    for project_dir in projects:
+                        if not project_dir.is_dir():
+                            continue
+                        candidate = Path(os.path.join(project_dir.path, target))
+                        session_data = FileProcessor.load_json_file(candidate)
+                        if session_data is not None:
+                            index[session_id] = candidate
+                            if "title" in session_data:
+                                return session_data["title"]
+                            return None
+            except OSError:
+                pass
+            return None
 
+        session_data = FileProcessor.load_json_file(session_file)
+        if session_data and "title" in session_data:
+            return session_data["title"]
         return None
 
     @staticmethod
@@ -217,22 +349,24 @@ class FileProcessor:
             # Handle fully qualified model names
             model_id = FileProcessor._extract_model_name(model_id)
 
-            # Extract token usage
-            tokens_data = data.get('tokens', {})
-            cache_data = tokens_data.get('cache', {})
-
-            tokens = TokenUsage(
-                input=tokens_data.get('input', 0),
-                output=tokens_data.get('output', 0),
-                cache_write=cache_data.get('write', 0),
-                cache_read=cache_data.get('read', 0)
+            # Extract token usage. model_construct skips validation, which
+            # is safe here: session files are machine-written by OpenCode
+            # and the values are normalized with `or 0` for missing/null.
+            tokens_data = data.get('tokens') or _EMPTY
+            cache_data = tokens_data.get('cache') or _EMPTY
+
+            tokens = TokenUsage.model_construct(
+                input=tokens_data.get('input') or 0,
+                output=tokens_data.get('output') or 0,
+                cache_write=cache_data.get('write') or 0,
+                cache_read=cache_data.get('read') or 0
             )
 
             # Extract time data
             time_data = None
             if 'time' in data:
                 time_info = data['time']
-                time_data = TimeData(
+                time_data = TimeData.model_construct(
                     created=time_info.get('created'),
                     completed=time_info.get('completed')
                 )
@@ -247,15 +381,14 @@ class FileProcessor:
             # Extract agent type (e.g., 'explore', 'plan', 'build')
             agent = data.get('agent')
 
-            return InteractionFile(
+            return InteractionFile.model_construct(
                 file_path=file_path,
                 session_id=session_id,
                 model_id=model_id,
                 tokens=tokens,
                 time_data=time_data,
                 project_path=project_path,
-                agent=agent,
-                raw_data=data
+                agent=agent
             )
 
         except (KeyError, ValueError, TypeError):
@@ -319,11 +452,24 @@ class FileProcessor:
         Returns:
             Most recent SessionData or None if no sessions found
         """
-        session_dirs = FileProcessor.find_session_directories(base_path)
-        if not session_dirs:
+        # Only the newest directory is wanted, so a single-pass max beats
+        # sorting the whole listing
+        try:
+            with os.scandir(base_path) as entries:
+                newest = max(
+                    (
+                        (entry.stat().st_mtime, entry.path)
+                        for entry in entries
+                        if entry.name.startswith('ses_') and entry.is_dir()
+                    ),
+                    default=None,
+                )
+        except OSError:
             return None
 
-        return FileProcessor.load_session_data(session_dirs[0])
+        if newest is None:
+            return None
+        return FileProcessor.load_session_data(Path(newest[1]))
 
     @staticmethod
     def get_most_recent_file(session_path: Path) -> Optional[InteractionFile]:
@@ -335,12 +481,22 @@ class FileProcessor:
         Returns:
             Most recent InteractionFile or None if no files found
         """
-        json_files = FileProcessor.find_json_files(session_path)
-        if not json_files:
+        try:
+            with os.scandir(session_path) as entries:
+                newest = max(
+                    (
+                        (entry.stat().st_mtime, entry.path)
+                        for entry in entries
+                        if entry.name.endswith('.json')
+                    ),
+                    default=None,
+                )
+        except OSError:
             return None
 
-        session_id = session_path.name
-        return FileProcessor.parse_interaction_file(json_files[0], session_id)
+        if newest is None:
+            return None
+        return FileProcessor.parse_interaction_file(Path(newest[1]), session_path.name)
 
     @staticmethod
     def load_all_sessions(base_path: str, limit: Optional[int] = None) -> List[SessionData]:
@@ -358,13 +514,20 @@ class FileProcessor:
         if limit:
             session_dirs = session_dirs[:limit]
 
-        sessions = []
-        for session_dir in session_dirs:
-            session_data = FileProcessor.load_session_data(session_dir)
-            if session_data:
-                sessions.append(session_data)
+        if len(session_dirs) <= 1:
+            sessions = [
+                FileProcessor.load_session_data(session_dir)
+                for session_dir in session_dirs
+            ]
+        else:
+            # Loading is I/O-bound (stat + read + parse per file), so
+            # overlap sessions across threads; map preserves order
+            with ThreadPoolExecutor(max_workers=min(8, len(session_dirs))) as executor:
+                sessions = list(
+                    executor.map(FileProcessor.load_session_data, session_dirs)
+                )
 
-        return sessions
+        return [session for session in sessions if session]
 
     @staticmethod
     def session_generator(base_path: str) -> Generator[SessionData, None, None]:
@@ -393,23 +556,17 @@ class FileProcessor:
         Returns:
             True if valid session structure, False otherwise
         """
-        if not session_path.exists() or not session_path.is_dir():
-            return False
-
         if not session_path.name.startswith('ses_'):
             return False
 
-        json_files = FileProcessor.find_json_files(session_path)
-        if not json_files:
+        try:
+            dir_mtime_ns = session_path.stat().st_mtime_ns
+        except OSError:
+            return False
+        if not session_path.is_dir():
             return False
 
-        # Check if at least one file has valid structure
-        for json_file in json_files[:3]:  # Check first 3 files
-            data = FileProcessor.load_json_file(json_file)
-            if data and ('tokens' in data or 'modelID' in data):
-                return True
-
-        return False
+        return _validate_structure_cached(str(session_path), dir_mtime_ns)
 
     @staticmethod
     def get_session_stats(session_path: Path) -> Dict[str, Any]:
@@ -421,28 +578,42 @@ class FileProcessor:
         Returns:
             Dictionary with basic session statistics
         """
-        if not FileProcessor.validate_session_structure(session_path):
+        if not session_path.name.startswith('ses_'):
             return {}
 
-        json_files = FileProcessor.find_json_files(session_path)
+        # One scandir pass yields name, mtime and size together; going
+        # through validate_session_structure plus find_json_files would
+        # list the directory twice and re-stat every file for its size
+        try:
+            with os.scandir(session_path) as entries:
+                records = []
+                for entry in entries:
+                    if entry.name.endswith('.json'):
+                        entry_stat = entry.stat()
+                        records.append(
+                            (entry_stat.st_mtime, entry.name, entry_stat.st_size)
+                        )
+        except OSError:
+            return {}
+
+        if not records:
+            return {}
+
+        records.sort(reverse=True)
+
+        # Structural check on the newest files, same as
+        # validate_session_structure
+        for _, name, _ in records[:3]:
+            data = FileProcessor.load_json_file(session_path / name)
+            if data and ('tokens' in data or 'modelID' in data):
+                break
+        else:
+            return {}
 
-        stats = {
+        return {
             'session_id': session_path.name,
-            'file_count': len(json_files),
-            'first_file': None,
-            'last_file': None,
-            'total_size_bytes': 0
-        }
-
-        if json_files:
-            stats['first_file'] = json_files[-1].name  # Oldest file
-            stats['last_file'] = json_files[0].name    # Newest file
-
-            # Calculate total size
-            for json_file in json_files:
-                try:
-                    stats['total_size_bytes'] += json_file.stat().st_size
-                except OSError:
-                    pass
-
-        return stats
\ No newline at end of file
+            'file_count': len(records),
+            'first_file': records[-1][1],  # Oldest file
+            'last_file': records[0][1],    # Newest file
+            'total_size_bytes': sum(size for _, _, size in records)
+        }
\ No newline at end of file
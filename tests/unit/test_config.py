@@ -229,11 +229,16 @@ class TestConfigManager:
         
         # Load config
         config1 = manager.config
-        
-        # Reload
+
+        # Reload without file changes keeps the parsed config
+        manager.reload()
+        assert manager.config is config1
+
+        # Reload after the file changes re-parses it
+        sample_config_file.write_text(sample_config_file.read_text() + "\n# touched\n")
         manager.reload()
         config2 = manager.config
-        
+
         # Should be new instances
         assert config1 is not config2
     